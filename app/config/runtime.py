@@ -3,8 +3,10 @@ Runtime configuration for robust base-URL handling across environments.
 """
 
 import os
+import re
 import socket
 import logging
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 from typing import Optional
 
@@ -12,7 +14,22 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 # Base URL Configuration - Single source of truth for all environments
-BASE_URL = os.getenv("APP_BASE_URL", "http://127.0.0.1:8000")
+DEFAULT_BASE_URL = "http://127.0.0.1:8000"
+
+def get_base_url() -> str:
+    """
+    Read the base URL from the environment at call time.
+    
+    Returns:
+        The value of APP_BASE_URL, or the local default when unset
+    """
+    return os.getenv("APP_BASE_URL", DEFAULT_BASE_URL)
+
+def __getattr__(name: str):
+    # Keep `runtime.BASE_URL` / `from runtime import BASE_URL` working
+    if name == "BASE_URL":
+        return get_base_url()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def build_url(path: str) -> str:
     """
@@ -32,15 +49,20 @@ def build_url(path: str) -> str:
         >>> build_url("")  # Empty path
         'http://127.0.0.1:8000'
     """
+    base_url = get_base_url()
     if not path:
-        return BASE_URL.rstrip('/')
+        return base_url.rstrip('/')
     
     # Ensure path starts with / for proper URL joining
     if not path.startswith('/'):
         path = '/' + path
     
-    return urljoin(BASE_URL, path)
+    return urljoin(base_url, path)
+
+# Authority (netloc) that is bracketed or contains a "::" IPv6 shorthand
+_IPV6_NETLOC_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://(?:\[[^/?#]*\]|[^/?#]*::)")
 
+@lru_cache(maxsize=1024)
 def is_ipv6_url(url: str) -> bool:
     """
     Check if a URL uses IPv6 addressing.
@@ -51,36 +73,17 @@ def is_ipv6_url(url: str) -> bool:
     Returns:
         True if the URL contains IPv6 addressing
     """
-    try:
-        parsed = urlparse(url)
-        # For IPv6 addresses, urlparse may not extract hostname correctly
-        # Check the netloc directly for IPv6 patterns
-        netloc = parsed.netloc
-        
-        # Check for IPv6 patterns in netloc
-        if '::' in netloc:
-            return True
-        
-        # Check for bracketed IPv6 addresses
-        if netloc.startswith('[') and ']' in netloc:
-            return True
-        
-        # Check for specific IPv6 localhost
-        if netloc.startswith('::1:'):
-            return True
-            
-        return False
-    except Exception:
-        return False
+    return _IPV6_NETLOC_RE.match(url) is not None
 
 def log_startup_info():
     """
     Log startup information about BASE_URL and IPv6 detection.
     """
-    logger.info(f"🚀 Application starting with BASE_URL: {BASE_URL}")
+    base_url = get_base_url()
+    logger.info(f"🚀 Application starting with BASE_URL: {base_url}")
     
     # Check for IPv6 usage
-    if is_ipv6_url(BASE_URL):
+    if is_ipv6_url(base_url):
         logger.warning(
             "⚠️  IPv6 detected in BASE_URL. This may cause connection issues in some environments. "
             "Consider using IPv4 (127.0.0.1) or container service names for Docker environments."
@@ -116,10 +119,11 @@ def validate_base_url() -> bool:
     Returns:
         True if BASE_URL is valid, False otherwise
     """
+    base_url = get_base_url()
     try:
-        parsed = urlparse(BASE_URL)
+        parsed = urlparse(base_url)
         if not parsed.scheme or not parsed.netloc:
-            logger.error(f"❌ Invalid BASE_URL format: {BASE_URL}")
+            logger.error(f"❌ Invalid BASE_URL format: {base_url}")
             return False
         
         # Check for common issues
@@ -127,7 +131,7 @@ def validate_base_url() -> bool:
             logger.error(f"❌ Unsupported scheme in BASE_URL: {parsed.scheme}")
             return False
         
-        logger.info(f"✅ BASE_URL validation passed: {BASE_URL}")
+        logger.info(f"✅ BASE_URL validation passed: {base_url}")
         return True
         
     except Exception as e:
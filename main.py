@@ -5,6 +5,8 @@ A FastAPI-based web application for professional automotive inspections.
 
 import json
 import os
+import orjson
+import secrets
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -150,22 +152,22 @@ class InspectionUpdate(BaseModel):
 def load_json_file(file_path: Path, default: Any = None) -> Any:
     """Load JSON file with error handling."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError):
         return default
 
 def save_json_file(file_path: Path, data: Any) -> None:
     """Save data to JSON file with error handling."""
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save data: {str(e)}")
 
 def generate_inspection_id() -> str:
-    """Generate unique inspection ID."""
-    return f"{INSPECTION_ID_PREFIX}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    """Generate unique inspection ID (random, so same-second creates don't collide)."""
+    return f"{INSPECTION_ID_PREFIX}_{secrets.token_hex(4)}"
 
 def find_inspection(inspection_id: str) -> Optional[Dict[str, Any]]:
     """Find inspection by ID."""
@@ -188,13 +190,24 @@ def validate_inspection_data(data: Dict[str, Any]) -> bool:
     required_fields = ["id", "title", "industry_info", "inspector_name", "inspector_id", "date", "categories", "industry_type"]
     return all(field in data for field in required_fields)
 
+# Parsed industry templates; they don't change while the app is running
+_industry_templates: Dict[str, Dict[str, Any]] = {}
+
 def get_industry_template(industry_type: str) -> Optional[Dict[str, Any]]:
-    """Get inspection template for automotive industry."""
+    """Get inspection template for automotive industry.
+    
+    The parsed template is cached and shared between callers, so treat it
+    as read-only. A missing or unreadable file is retried on the next call.
+    """
     if industry_type != "automotive":
         return None
     
-    template_file = Path(AUTOMOTIVE_INDUSTRY["template_file"])
-    return load_json_file(template_file)
+    template = _industry_templates.get(industry_type)
+    if template is None:
+        template = load_json_file(Path(AUTOMOTIVE_INDUSTRY["template_file"]))
+        if template is not None:
+            _industry_templates[industry_type] = template
+    return template
 
 def generate_pdf_report(inspection: Dict[str, Any]) -> str:
     """Generate PDF report for inspection."""
@@ -1,8 +1,9 @@
+import copy
 import json
+import orjson
+import secrets
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
-import os
+from typing import Dict, Any, Optional, Tuple
 
 TEMPLATE_PATH = Path(__file__).parent / "templates.json"
 AUTOMOTIVE_TEMPLATE_PATH = Path("templates/industries/automotive.json")
@@ -11,13 +12,13 @@ def load_inspection_template() -> Dict[str, Any]:
     """Load the inspection template from JSON file."""
     # Try to load the automotive template first
     try:
-        with open(AUTOMOTIVE_TEMPLATE_PATH, "r") as f:
-            return json.load(f)
+        with open(AUTOMOTIVE_TEMPLATE_PATH, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         # Fallback to the default template
         try:
-            with open(TEMPLATE_PATH, "r") as f:
-                return json.load(f)
+            with open(TEMPLATE_PATH, "rb") as f:
+                return orjson.loads(f.read())
         except FileNotFoundError:
             return {"inspection_points": {}}
         except json.JSONDecodeError:
@@ -25,8 +26,8 @@ def load_inspection_template() -> Dict[str, Any]:
     except json.JSONDecodeError:
         # Fallback to the default template
         try:
-            with open(TEMPLATE_PATH, "r") as f:
-                return json.load(f)
+            with open(TEMPLATE_PATH, "rb") as f:
+                return orjson.loads(f.read())
         except FileNotFoundError:
             return {"inspection_points": {}}
         except json.JSONDecodeError:
@@ -36,8 +37,8 @@ def save_inspection_template(template: Dict[str, Any]) -> bool:
     """Save the inspection template to JSON file."""
     try:
         # Save to automotive template by default
-        with open(AUTOMOTIVE_TEMPLATE_PATH, "w") as f:
-            json.dump(template, f, indent=2)
+        with open(AUTOMOTIVE_TEMPLATE_PATH, "wb") as f:
+            f.write(orjson.dumps(template, option=orjson.OPT_INDENT_2))
         return True
     except Exception:
         return False
@@ -48,12 +49,55 @@ def get_inspection_data_file() -> Path:
     data_dir.mkdir(exist_ok=True)
     return data_dir / "inspections.json"
 
-def load_inspections() -> list:
-    """Load all inspections from the data file and migrate old format to new format."""
+# Parsed inspections, keyed by the data file's raw bytes. Other writers
+# (main.py, other worker processes) can rewrite the file without changing its
+# size or mtime, so the file is re-read on every lookup, but it is only
+# re-parsed when its contents differ
+_inspections_cache: Optional[Tuple[bytes, list, Dict[str, int]]] = None
+
+def _index_by_id(inspections: list) -> Dict[str, int]:
+    """Map each inspection id to its position (first occurrence wins)."""
+    index = {}
+    for position, inspection in enumerate(inspections):
+        index.setdefault(inspection.get("id"), position)
+    return index
+
+def _cache_inspections(raw: bytes, inspections: list) -> None:
+    """Remember inspections as the parsed form of raw."""
+    global _inspections_cache
+    _inspections_cache = (raw, inspections, _index_by_id(inspections))
+
+def _write_inspections(inspections: list) -> bool:
+    """Write all inspections to the data file and refresh the cache."""
+    global _inspections_cache
     data_file = get_inspection_data_file()
     try:
-        with open(data_file, "r") as f:
-            inspections = json.load(f)
+        raw = orjson.dumps(inspections, option=orjson.OPT_INDENT_2)
+        with open(data_file, "wb") as f:
+            f.write(raw)
+        _cache_inspections(raw, inspections)
+        return True
+    except Exception:
+        _inspections_cache = None
+        return False
+
+def _load_indexed() -> Tuple[list, Dict[str, int]]:
+    """Return the cached inspections and id index, re-parsing if the file changed.
+    
+    The returned list is shared with the cache and must not be mutated.
+    """
+    data_file = get_inspection_data_file()
+    try:
+        with open(data_file, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return [], {}
+    
+    if _inspections_cache is not None and _inspections_cache[0] == raw:
+        return _inspections_cache[1], _inspections_cache[2]
+    
+    try:
+        inspections = orjson.loads(raw)
         
         # Migrate old format inspections to new format
         migrated = False
@@ -64,12 +108,18 @@ def load_inspections() -> list:
         
         # Save back if migrations were performed
         if migrated:
-            with open(data_file, "w") as f:
-                json.dump(inspections, f, indent=2)
+            raw = orjson.dumps(inspections, option=orjson.OPT_INDENT_2)
+            with open(data_file, "wb") as f:
+                f.write(raw)
         
-        return inspections
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+        _cache_inspections(raw, inspections)
+        return inspections, _inspections_cache[2]
+    except json.JSONDecodeError:
+        return [], {}
+
+def load_inspections() -> list:
+    """Load all inspections from the data file and migrate old format to new format."""
+    return list(_load_indexed()[0])
 
 def needs_migration(inspection: Dict[str, Any]) -> bool:
     """Check if inspection needs migration from old format to new format."""
@@ -131,39 +181,36 @@ def migrate_inspection_format(inspection: Dict[str, Any]) -> None:
 
 def save_inspection(inspection_data: Dict[str, Any]) -> bool:
     """Save a new inspection to the data file."""
-    inspections = load_inspections()
-    inspections.append(inspection_data)
-    
-    data_file = get_inspection_data_file()
-    try:
-        with open(data_file, "w") as f:
-            json.dump(inspections, f, indent=2)
-        return True
-    except Exception:
-        return False
+    inspections, _ = _load_indexed()
+    return _write_inspections(inspections + [copy.deepcopy(inspection_data)])
 
 def find_inspection(inspection_id: str) -> Optional[Dict[str, Any]]:
-    """Find an inspection by ID."""
-    inspections = load_inspections()
-    return next((i for i in inspections if i.get("id") == inspection_id), None)
+    """Find an inspection by ID.
+    
+    Returns a copy, so callers can modify it before passing it to
+    update_inspection without touching the cached data.
+    """
+    inspections, index = _load_indexed()
+    position = index.get(inspection_id)
+    if position is None:
+        return None
+    return copy.deepcopy(inspections[position])
 
 def update_inspection(inspection_id: str, updated_data: Dict[str, Any]) -> bool:
     """Update an existing inspection."""
-    inspections = load_inspections()
-    
-    for i, inspection in enumerate(inspections):
-        if inspection.get("id") == inspection_id:
-            inspections[i] = updated_data
-            data_file = get_inspection_data_file()
-            try:
-                with open(data_file, "w") as f:
-                    json.dump(inspections, f, indent=2)
-                return True
-            except Exception:
-                return False
+    inspections, index = _load_indexed()
+    position = index.get(inspection_id)
+    if position is None:
+        return False
     
-    return False
+    updated = list(inspections)
+    updated[position] = copy.deepcopy(updated_data)
+    return _write_inspections(updated)
 
 def generate_inspection_id() -> str:
-    """Generate a unique inspection ID."""
-    return f"INSP_{datetime.now().strftime('%Y%m%d_%H%M%S')}" 
\ No newline at end of file
+    """Generate a unique inspection ID.
+    
+    Uses 32 random bits rather than the current second, which handed out
+    duplicate IDs to inspections created within the same second.
+    """
+    return f"INSP_{secrets.token_hex(4)}"
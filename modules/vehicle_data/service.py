@@ -6,7 +6,7 @@ import httpx
 import json
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from .vin_decoder import parse_vin_response
 from .models import VehicleInfo
 
@@ -19,6 +19,11 @@ NHTSA_API = "https://vpic.nhtsa.dot.gov/api/vehicles/DecodeVinValues/{vin}?forma
 # Fallback static data file
 STATIC_DATA_FILE = Path(__file__).parent / "static_vin_data.json"
 
+# Successfully decoded VINs; a VIN's vehicle data never changes, so repeat
+# lookups skip the NHTSA round trip. Oldest entries are evicted past the cap.
+VIN_CACHE_SIZE = 1024
+_decoded_vins: Dict[str, VehicleInfo] = {}
+
 def merge_vehicle_data(primary: VehicleInfo, secondary: VehicleInfo) -> VehicleInfo:
     """
     Merge two VehicleInfo objects, using primary data when available, falling back to secondary.
@@ -162,6 +167,10 @@ async def decode_vin(vin: str) -> VehicleInfo:
     Raises:
         Exception: If all services fail
     """
+    cached = _decoded_vins.get(vin)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+    
     vehicle_info = None
     
     # Try NHTSA API to supplement or replace limited data
@@ -220,6 +229,9 @@ async def decode_vin(vin: str) -> VehicleInfo:
     
     # Return vehicle info or minimal info with just the VIN
     if vehicle_info and vehicle_info.make:
+        if len(_decoded_vins) >= VIN_CACHE_SIZE:
+            del _decoded_vins[next(iter(_decoded_vins))]
+        _decoded_vins[vin] = vehicle_info.model_copy(deep=True)
         return vehicle_info
     else:
         print(f"Returning minimal vehicle info for VIN {vin}")
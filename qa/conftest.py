@@ -3,6 +3,7 @@ Pytest configuration and plugins for Playwright browser tests.
 Provides enhanced failure artifact capture for debugging.
 """
 
+import logging
 import os
 import pytest
 import time
@@ -64,9 +65,7 @@ class PlaywrightArtifactCapture:
         # Capture HTML snapshot
         try:
             html_path = test_dir / "html" / f"{error_type}_{timestamp}.html"
-            html_content = self.current_page.content()
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            html_path.write_text(self.current_page.content(), encoding='utf-8')
             artifacts["html_snapshot"] = str(html_path.relative_to(QA_DIR))
         except Exception as e:
             print(f"Failed to capture HTML snapshot: {e}")
@@ -101,9 +100,11 @@ def page_with_artifacts(page: Page, request):
     
     yield page
     
-    # Capture artifacts on test completion (success or failure)
-    if request.node.rep_call.failed:
-        artifacts = artifact_capture.capture_artifacts("failure")
+    # Capture artifacts on test completion (success or failure); reuse what the
+    # report hook already captured rather than serializing the page a second time
+    rep_call = getattr(request.node, "rep_call", None)
+    if rep_call is not None and rep_call.failed:
+        artifacts = artifact_capture.get_test_artifacts(test_name) or artifact_capture.capture_artifacts("failure")
         print(f"\nTest failed. Artifacts captured:")
         for artifact_type, path in artifacts.items():
             if path:
@@ -115,6 +116,7 @@ def pytest_runtest_makereport(item, call):
     """Hook to capture artifacts on test failures."""
     outcome = yield
     rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
     
     # Only capture on failures
     if rep.when == "call" and rep.failed:
@@ -148,6 +150,17 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "browser: mark test as browser-based test"
     )
+    
+    # Route qa.artifacts messages (step captures, write failures) to stdout at INFO;
+    # imported here because test_artifact_helpers imports this module
+    from test_artifact_helpers import start_artifact_logging
+    start_artifact_logging(logging.INFO)
+
+
+def pytest_unconfigure(config):
+    """Flush queued qa.artifacts log records before pytest exits."""
+    from test_artifact_helpers import stop_artifact_logging
+    stop_artifact_logging()
 
 
 def pytest_collection_modifyitems(config, items):
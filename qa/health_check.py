@@ -4,12 +4,28 @@ Health Check Utility for CheckMate Virtue
 Polls the /healthz endpoint with exponential backoff to ensure the service is ready.
 """
 
+import asyncio
+import atexit
 import os
+import random
 import time
 import httpx
-from typing import Optional
+from typing import List, Optional
 from urllib.parse import urljoin
 
+# Shared keep-alive client so repeated probes reuse one connection
+_CLIENT = httpx.Client(
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+)
+atexit.register(_CLIENT.close)
+
+# One-shot checks fail fast when nothing is listening
+CHECK_TIMEOUT = httpx.Timeout(1.0, connect=0.25)
+
+# Fraction of each backoff delay randomized to spread retries across clients
+BACKOFF_JITTER = 0.2
+
 def get_base_url() -> str:
     """Get the base URL from environment or use default."""
     from app.config.runtime import BASE_URL
@@ -20,7 +36,8 @@ def wait_for_health(
     timeout: int = 60,
     initial_delay: float = 1.0,
     max_delay: float = 10.0,
-    backoff_factor: float = 2.0
+    backoff_factor: float = 2.0,
+    client: Optional[httpx.Client] = None
 ) -> bool:
     """
     Wait for the service to become healthy by polling the /healthz endpoint.
@@ -31,6 +48,8 @@ def wait_for_health(
         initial_delay: Initial delay between attempts in seconds
         max_delay: Maximum delay between attempts in seconds
         backoff_factor: Factor to multiply delay by on each failure
+            (each delay is jittered by +/- BACKOFF_JITTER)
+        client: HTTP client to probe with (defaults to the shared module client)
         
     Returns:
         True if service becomes healthy within timeout, False otherwise
@@ -40,47 +59,49 @@ def wait_for_health(
     """
     if base_url is None:
         base_url = get_base_url()
+    if client is None:
+        client = _CLIENT
     
     health_url = urljoin(base_url, "/healthz")
-    start_time = time.time()
-    delay = initial_delay
+    deadline = time.monotonic() + timeout
+    attempt = 0
     
     print(f"Waiting for service to become healthy at {health_url}")
     
-    while time.time() - start_time < timeout:
+    while time.monotonic() < deadline:
         try:
-            with httpx.Client(timeout=5.0) as client:
-                response = client.get(health_url)
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("status") == "ok":
-                        print(f"Service is healthy! Response: {data}")
-                        return True
-                    else:
-                        print(f"Service responded but status is not 'ok': {data}")
+            response = client.get(health_url)
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("status") == "ok":
+                    print(f"Service is healthy! Response: {data}")
+                    return True
                 else:
-                    print(f"Service responded with status code: {response.status_code}")
-                    
+                    print(f"Service responded but status is not 'ok': {data}")
+            else:
+                print(f"Service responded with status code: {response.status_code}")
+                
         except httpx.RequestError as e:
             print(f"Connection failed: {e}")
         except Exception as e:
             print(f"Unexpected error: {e}")
         
-        # Wait before next attempt
-        time.sleep(delay)
-        
-        # Exponential backoff
-        delay = min(delay * backoff_factor, max_delay)
+        # Capped exponential backoff with jitter before next attempt
+        delay = min(max_delay, initial_delay * backoff_factor ** attempt)
+        time.sleep(delay * (1 + random.uniform(-BACKOFF_JITTER, BACKOFF_JITTER)))
+        if delay < max_delay:
+            attempt += 1
     
     print(f"Service did not become healthy within {timeout} seconds")
     return False
 
-def check_health(base_url: Optional[str] = None) -> bool:
+def check_health(base_url: Optional[str] = None, client: Optional[httpx.Client] = None) -> bool:
     """
     Simple health check without waiting.
     
     Args:
         base_url: Base URL of the service (defaults to APP_BASE_URL env var)
+        client: HTTP client to probe with (defaults to the shared module client)
         
     Returns:
         True if service is healthy, False otherwise
@@ -88,26 +109,104 @@ def check_health(base_url: Optional[str] = None) -> bool:
     if base_url is None:
         base_url = get_base_url()
     
+    if client is None:
+        client = _CLIENT
+    
     health_url = urljoin(base_url, "/healthz")
     
     try:
-        with httpx.Client(timeout=5.0) as client:
-            response = client.get(health_url)
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("status") == "ok"
+        response = client.get(health_url, timeout=CHECK_TIMEOUT)
+        if response.status_code == 200:
+            data = response.json()
+            return data.get("status") == "ok"
     except Exception:
         pass
     
     return False
 
+async def _probe_async(client: httpx.AsyncClient, base_url: str) -> bool:
+    """Return True if the service at base_url reports a healthy status."""
+    try:
+        response = await client.get(urljoin(base_url, "/healthz"))
+        if response.status_code == 200:
+            return response.json().get("status") == "ok"
+    except Exception:
+        pass
+    
+    return False
+
+async def check_health_async(urls: List[str], client: httpx.AsyncClient) -> List[bool]:
+    """
+    Probe several services concurrently.
+    
+    Args:
+        urls: Base URLs of the services to probe
+        client: Async HTTP client to probe with
+        
+    Returns:
+        Health result for each URL, in the same order as urls
+    """
+    return list(await asyncio.gather(*(_probe_async(client, url) for url in urls)))
+
+async def wait_for_all_healthy(
+    urls: List[str],
+    timeout: int = 60,
+    initial_delay: float = 1.0,
+    max_delay: float = 10.0,
+    backoff_factor: float = 2.0,
+    client: Optional[httpx.AsyncClient] = None
+) -> bool:
+    """
+    Wait for several services to become healthy, probing them concurrently.
+    
+    Each polling cycle probes every service that is not yet healthy in one
+    batch, so startup waits overlap instead of adding up per service.
+    
+    Args:
+        urls: Base URLs of the services to wait for
+        timeout: Maximum time to wait in seconds
+        initial_delay: Initial delay between polling cycles in seconds
+        max_delay: Maximum delay between polling cycles in seconds
+        backoff_factor: Factor to multiply delay by on each failed cycle
+        client: Async HTTP client to probe with (a temporary one is created if omitted)
+        
+    Returns:
+        True if all services become healthy within timeout, False otherwise
+    """
+    if client is None:
+        async with httpx.AsyncClient(timeout=5.0) as owned_client:
+            return await wait_for_all_healthy(
+                urls, timeout, initial_delay, max_delay, backoff_factor, owned_client
+            )
+    
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    pending = list(urls)
+    
+    print(f"Waiting for {len(pending)} service(s) to become healthy")
+    
+    while time.monotonic() < deadline:
+        results = await check_health_async(pending, client)
+        pending = [url for url, healthy in zip(pending, results) if not healthy]
+        if not pending:
+            print("All services are healthy!")
+            return True
+        print(f"Still waiting on: {', '.join(pending)}")
+        
+        # Capped exponential backoff with jitter before next cycle
+        delay = min(max_delay, initial_delay * backoff_factor ** attempt)
+        await asyncio.sleep(delay * (1 + random.uniform(-BACKOFF_JITTER, BACKOFF_JITTER)))
+        if delay < max_delay:
+            attempt += 1
+    
+    print(f"Services did not become healthy within {timeout} seconds: {', '.join(pending)}")
+    return False
+
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1:
-        base_url = sys.argv[1]
+    if len(sys.argv) > 2:
+        success = asyncio.run(wait_for_all_healthy(sys.argv[1:]))
     else:
-        base_url = None
-    
-    success = wait_for_health(base_url)
+        success = wait_for_health(sys.argv[1] if len(sys.argv) > 1 else None)
     sys.exit(0 if success else 1)
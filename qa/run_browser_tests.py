@@ -9,13 +9,15 @@ import json
 import os
 import sys
 import time
-import traceback
+from collections import Counter, defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from urllib.parse import urlparse
 
+import httpx
+
 try:
     from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
 except ImportError:
@@ -66,12 +68,37 @@ except ImportError:
             print(f"❌ Regression test failed: {e}")
             return False
 
+# Rarely needed modules are imported on first use; None means "not resolved yet"
+_orjson = None
+
+
+def _load_orjson():
+    """Return the orjson module, or None when it is not installed."""
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson or None
+
+
+def _format_exc() -> str:
+    """Format the current exception, importing traceback only on error paths."""
+    import traceback
+    return traceback.format_exc()
+
 # Configuration
 from app.config.runtime import BASE_URL
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
 TIMEOUT = int(os.getenv("TIMEOUT", "30000"))
 RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "2"))
 WAIT_FOR_IDLE = int(os.getenv("WAIT_FOR_IDLE", "2000"))
+FAST_MODE = os.getenv("FAST_MODE", "true").lower() == "true"
+
+# Resource types aborted in fast mode; irrelevant to form/link testing
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
 
 # Test credentials (from env or defaults)
 TEST_USERNAME = os.getenv("TEST_USERNAME", "test@example.com")
@@ -110,6 +137,7 @@ SCREENSHOTS_DIR = LOGS_DIR / "screenshots"
 ARTIFACTS_DIR = QA_DIR / "artifacts"
 HTML_DIR = ARTIFACTS_DIR / "html"
 SERVICE_MAP_FILE = QA_DIR / "service_map.json"
+AUTH_STATE_FILE = QA_DIR / ".auth" / "state.json"
 
 # Ensure directories exist
 LOGS_DIR.mkdir(exist_ok=True)
@@ -134,11 +162,23 @@ class BrowserTestRunner:
     
     def __init__(self):
         self.errors: List[ErrorLog] = []
+        # Running tallies kept in step with self.errors by log_error
+        self._service_counts: Counter = Counter()
+        self._grouped_errors: Dict[str, Dict[str, List[Dict[str, Any]]]] = defaultdict(lambda: defaultdict(list))
         self.service_map: Dict[str, str] = {}
         self.current_page: Optional[str] = None
         self.first_error_per_page: Dict[str, bool] = {}
         self.test_inspection_id: Optional[str] = None
         self.test_invoice_id: Optional[str] = None
+        self.auth_state_loaded: bool = False
+        # One keep-alive pool shared by every direct API call
+        self.http = httpx.Client(
+            base_url=BASE_URL,
+            http2=True,
+            timeout=TIMEOUT / 1000,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            headers={"Content-Type": "application/json"}
+        )
         
         # Load service mapping
         self._load_service_map()
@@ -146,6 +186,10 @@ class BrowserTestRunner:
         # Ensure service is healthy before running tests
         self._ensure_service_health()
     
+    def close(self):
+        """Release the shared API connection pool."""
+        self.http.close()
+    
     def _ensure_service_health(self):
         """Ensure the service is healthy before running tests."""
         try:
@@ -169,6 +213,73 @@ class BrowserTestRunner:
             print(f"Warning: Service map file not found at {SERVICE_MAP_FILE}")
             self.service_map = {}
     
+    def _new_context(self, browser: Browser) -> BrowserContext:
+        """Create a browser context, reusing saved auth state when available."""
+        context = None
+        if AUTH_STATE_FILE.exists():
+            try:
+                context = browser.new_context(storage_state=str(AUTH_STATE_FILE))
+                self.auth_state_loaded = True
+                print(f"Loaded saved authentication state from {AUTH_STATE_FILE}")
+            except Exception as e:
+                print(f"Warning: Could not load auth state, starting fresh: {e}")
+        if context is None:
+            self.auth_state_loaded = False
+            context = browser.new_context()
+        
+        if FAST_MODE:
+            context.route("**/*", self._block_heavy_resources)
+        return context
+    
+    @staticmethod
+    def _block_heavy_resources(route):
+        """Abort images, fonts and media; let documents, scripts and XHR through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+    
+    def _sync_session_cookies(self, page: Page):
+        """Send the browser session's cookies with direct API calls, as page.request did."""
+        # Set without a domain: the cookie jar never matches a "localhost" domain,
+        # and context.cookies(BASE_URL) already limits them to this host
+        for cookie in page.context.cookies(BASE_URL):
+            self.http.cookies.set(cookie["name"], cookie["value"], path=cookie["path"])
+    
+    @staticmethod
+    def _is_authenticated(page: Page) -> bool:
+        """Whether the page is past login: off /login and not asking for a password."""
+        if urlparse(page.url).path.rstrip("/") == "/login":
+            return False
+        return page.locator('input[type="password"]').count() == 0
+    
+    def _saved_session_valid(self, page: Page) -> bool:
+        """Check that a reused session still reaches an authenticated page."""
+        try:
+            page.goto(f"{BASE_URL}/inspections/new", timeout=TIMEOUT)
+            self.wait_for_network_idle(page)
+            return self._is_authenticated(page)
+        except Exception as e:
+            print(f"Warning: Could not verify saved auth state: {e}")
+            return False
+    
+    def _discard_auth_state(self, page: Page):
+        """Drop a dead saved session (expired, or signed with an old key) and log in fresh."""
+        AUTH_STATE_FILE.unlink(missing_ok=True)
+        page.context.clear_cookies()
+        self.auth_state_loaded = False
+        print(f"Saved authentication state is no longer valid, removed {AUTH_STATE_FILE}")
+    
+    def _save_auth_state(self, page: Page):
+        """Persist the authenticated context so later runs can skip login."""
+        try:
+            AUTH_STATE_FILE.parent.mkdir(exist_ok=True)
+            page.context.storage_state(path=str(AUTH_STATE_FILE))
+            self.auth_state_loaded = True
+            print(f"Authentication state saved to {AUTH_STATE_FILE}")
+        except Exception as e:
+            print(f"Warning: Could not save auth state: {e}")
+    
     def detect_service_from_url(self, url: str) -> str:
         """Detect service name from URL."""
         parsed = urlparse(url)
@@ -205,9 +316,7 @@ class BrowserTestRunner:
                 if not html_snapshot:
                     html_snapshot = f"artifacts/html/{service}_{error_type}_{timestamp}.html"
                     full_html_path = HTML_DIR / f"{service}_{error_type}_{timestamp}.html"
-                    html_content = page.content()
-                    with open(full_html_path, 'w', encoding='utf-8') as f:
-                        f.write(html_content)
+                    full_html_path.write_text(page.content(), encoding='utf-8')
                 
             except Exception as e:
                 print(f"Failed to capture artifacts: {e}")
@@ -229,6 +338,15 @@ class BrowserTestRunner:
         )
         
         self.errors.append(error)
+        self._service_counts[service] += 1
+        self._grouped_errors[service][error_type].append({
+            "message": error.message,
+            "url": error.url,
+            "timestamp": error.timestamp,
+            "screenshot_path": error.screenshot_path,
+            "html_snapshot": error.html_snapshot,
+            "stack_trace": error.stack_trace
+        })
         print(f"ERROR [{service}] {error_type}: {message}")
         if screenshot_path:
             print(f"  Screenshot: {screenshot_path}")
@@ -247,11 +365,12 @@ class BrowserTestRunner:
         # Page errors (unhandled exceptions)
         page.on("pageerror", lambda exc: 
             self.log_error("frontend", "UNHANDLED_EXCEPTION", str(exc), page.url, 
-                          stack_trace=traceback.format_exc(), page=page)
+                          stack_trace=_format_exc(), page=page)
         )
         
-        # Failed network requests
-        page.on("requestfailed", lambda req: 
+        # Failed network requests (ignoring the ones fast mode aborts on purpose)
+        page.on("requestfailed", lambda req: None
+            if FAST_MODE and req.resource_type in BLOCKED_RESOURCE_TYPES else
             self.log_error(
                 self.detect_service_from_url(req.url), 
                 "NETWORK_ERROR", 
@@ -666,6 +785,10 @@ class BrowserTestRunner:
         """Test authenticated routes (if login is available)."""
         print("\n=== Testing Authenticated Routes ===")
         
+        # Only trust a saved session while it still gets past login
+        if self.auth_state_loaded and not self._saved_session_valid(page):
+            self._discard_auth_state(page)
+        
         # Try to login if login page exists
         login_url = f"{BASE_URL}/login"
         try:
@@ -673,9 +796,14 @@ class BrowserTestRunner:
             if response.status == 200:
                 self.navigate_to_page(page, login_url, "Login page")
                 
-                # Test form interactions on login page
+                # Test form interactions on login page (also when the session is reused)
                 self.test_form_interactions(page, "login page")
                 
+                # Reuse the saved session instead of logging in again
+                if self.auth_state_loaded:
+                    self.test_authenticated_flows(page)
+                    return
+                
                 # Try to fill login form
                 try:
                     username_field = page.locator('input[name="username"], input[name="email"], input[type="email"]')
@@ -691,11 +819,20 @@ class BrowserTestRunner:
                             submit_button.first.click()
                             self.wait_for_network_idle(page)
                             
+                            # Only a login that actually got through is worth saving
+                            if not self._is_authenticated(page):
+                                self.log_error("auth-service", "LOGIN_ERROR", 
+                                              "Login did not leave the login page", login_url, page=page)
+                                return
+                            self._save_auth_state(page)
+                            
                             # Test authenticated routes after login
                             self.test_authenticated_flows(page)
                 except Exception as e:
                     self.log_error("auth-service", "LOGIN_ERROR", 
                                   f"Login form interaction failed: {str(e)}", login_url)
+            elif self.auth_state_loaded:
+                self.test_authenticated_flows(page)
         except Exception as e:
             print(f"Login page not available or error: {str(e)}")
     
@@ -731,15 +868,13 @@ class BrowserTestRunner:
             "industry_type": "automotive"
         }
         
+        self._sync_session_cookies(page)
+        
         try:
-            response = page.request.post(
-                f"{BASE_URL}/api/inspections",
-                data=json.dumps(test_inspection_data),
-                headers={"Content-Type": "application/json"}
-            )
-            if response.status >= 400:
+            response = self.http.post("/api/inspections", content=json.dumps(test_inspection_data))
+            if response.status_code >= 400:
                 self.log_error("inspection-service", "API_ERROR", 
-                              f"Inspection creation API failed: {response.status}", 
+                              f"Inspection creation API failed: {response.status_code}", 
                               f"{BASE_URL}/api/inspections")
             else:
                 print("  ✅ Inspection creation API test passed")
@@ -764,29 +899,23 @@ class BrowserTestRunner:
             ]
         }
         
+        invoice_body = json.dumps(test_invoice_data)
+        
         try:
             # Test canonical endpoint first
-            response = page.request.post(
-                f"{BASE_URL}/api/invoices",
-                data=json.dumps(test_invoice_data),
-                headers={"Content-Type": "application/json"}
-            )
-            if response.status >= 400:
+            response = self.http.post("/api/invoices", content=invoice_body)
+            if response.status_code >= 400:
                 self.log_error("invoice-service", "API_ERROR", 
-                              f"Canonical invoice creation API failed: {response.status}", 
+                              f"Canonical invoice creation API failed: {response.status_code}", 
                               f"{BASE_URL}/api/invoices")
             else:
                 print("  ✅ Canonical invoice creation API test passed")
                 
             # Test backward compatibility endpoint
-            response = page.request.post(
-                f"{BASE_URL}/invoices/api/invoices",
-                data=json.dumps(test_invoice_data),
-                headers={"Content-Type": "application/json"}
-            )
-            if response.status >= 400:
+            response = self.http.post("/invoices/api/invoices", content=invoice_body)
+            if response.status_code >= 400:
                 self.log_error("invoice-service", "API_ERROR", 
-                              f"Backward compatibility invoice creation API failed: {response.status}", 
+                              f"Backward compatibility invoice creation API failed: {response.status_code}", 
                               f"{BASE_URL}/invoices/api/invoices")
             else:
                 print("  ✅ Backward compatibility invoice creation API test passed")
@@ -833,26 +962,20 @@ class BrowserTestRunner:
     
     def save_error_logs(self):
         """Save error logs to files."""
-        # Group errors by service and type
-        grouped_errors = {}
-        for error in self.errors:
-            if error.service not in grouped_errors:
-                grouped_errors[error.service] = {}
-            if error.error_type not in grouped_errors[error.service]:
-                grouped_errors[error.service][error.error_type] = []
-            grouped_errors[error.service][error.error_type].append({
-                "message": error.message,
-                "url": error.url,
-                "timestamp": error.timestamp,
-                "screenshot_path": error.screenshot_path,
-                "html_snapshot": error.html_snapshot,
-                "stack_trace": error.stack_trace
-            })
+        # Errors are grouped by service and type as they are logged
+        grouped_errors = self._grouped_errors
         
         # Save JSON format
         json_file = LOGS_DIR / "error-log.json"
-        with open(json_file, 'w') as f:
-            json.dump(grouped_errors, f, indent=2, default=str)
+        orjson = _load_orjson()
+        if orjson is not None:
+            payload = orjson.dumps(grouped_errors, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            payload = json.dumps(grouped_errors, indent=2, default=str).encode("utf-8")
+        # Write to a temp file and swap it in so readers never see a partial log
+        tmp_file = json_file.with_suffix(".json.tmp")
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, json_file)
         
         # Save human-readable format
         txt_file = LOGS_DIR / "error-log.txt"
@@ -890,11 +1013,12 @@ class BrowserTestRunner:
         print(f"Base URL: {BASE_URL}")
         print(f"Headless: {HEADLESS}")
         print(f"Timeout: {TIMEOUT}ms")
+        print(f"Fast mode: {FAST_MODE}")
         print(f"Test Data: {json.dumps(TEST_DATA, indent=2)}")
         
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=HEADLESS)
-            context = browser.new_context()
+            context = self._new_context(browser)
             page = context.new_page()
             
             # Setup error handlers
@@ -922,7 +1046,7 @@ class BrowserTestRunner:
             except Exception as e:
                 self.log_error("test-runner", "TEST_ERROR", 
                               f"Test execution failed: {str(e)}", page.url,
-                              stack_trace=traceback.format_exc(), page=page)
+                              stack_trace=_format_exc(), page=page)
             
             finally:
                 # Take final screenshot
@@ -934,6 +1058,7 @@ class BrowserTestRunner:
                     print(f"Failed to take final screenshot: {e}")
                 
                 browser.close()
+                self.close()
         
         # Save error logs
         self.save_error_logs()
@@ -959,20 +1084,23 @@ class BrowserTestRunner:
         
         if self.errors:
             print("\nErrors by service:")
-            service_counts = {}
-            for error in self.errors:
-                service_counts[error.service] = service_counts.get(error.service, 0) + 1
-            
-            for service, count in sorted(service_counts.items()):
+            for service, count in sorted(self._service_counts.items()):
                 print(f"  {service}: {count} errors")
         
         return len(self.errors) == 0
 
 def main():
     """Main entry point."""
+    try:
+        from test_artifact_helpers import start_artifact_logging, stop_artifact_logging
+    except ImportError:
+        start_artifact_logging = stop_artifact_logging = lambda: None
+    
+    start_artifact_logging()
     try:
         runner = BrowserTestRunner()
         success = runner.run_tests()
+        stop_artifact_logging()
         
         if success:
             print("\n✅ All tests completed successfully!")
@@ -982,7 +1110,9 @@ def main():
             sys.exit(1)
             
     except Exception as e:
+        stop_artifact_logging()
         print(f"Fatal error: {e}")
+        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -5,7 +5,7 @@ This test shows how to use the new artifact capture system.
 
 import pytest
 from playwright.sync_api import Page
-from test_artifact_helpers import capture_failure_artifacts, log_artifacts_to_console
+from test_artifact_helpers import capture_failure_artifacts, log_artifacts_to_console, logger
 
 
 @pytest.mark.browser
@@ -53,20 +53,20 @@ def test_step_by_step_capture(page: Page):
     # Step 1: Navigate
     page.goto("https://example.com")
     artifacts = capture_failure_artifacts(page, "test_step_by_step_capture", "step_navigation")
-    print(f"Navigation step artifacts: {artifacts}")
+    logger.info("Navigation step artifacts: %s", artifacts)
     
     # Step 2: Check title
     title = page.title()
     if title != "Example Domain":
         artifacts = capture_failure_artifacts(page, "test_step_by_step_capture", "step_title_check")
-        print(f"Title check artifacts: {artifacts}")
+        logger.info("Title check artifacts: %s", artifacts)
         raise AssertionError(f"Expected title 'Example Domain', got '{title}'")
     
     # Step 3: Check content
     heading = page.locator("h1")
     if not heading.is_visible():
         artifacts = capture_failure_artifacts(page, "test_step_by_step_capture", "step_content_check")
-        print(f"Content check artifacts: {artifacts}")
+        logger.info("Content check artifacts: %s", artifacts)
         raise AssertionError("Expected heading not visible")
 
 
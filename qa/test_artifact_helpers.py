@@ -3,11 +3,21 @@ Enhanced test helpers for artifact capture in browser tests.
 Provides utilities for capturing screenshots and HTML snapshots on failures.
 """
 
+import atexit
+import functools
+import io
+import itertools
+import logging
 import os
+import queue
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from playwright.sync_api import Page
 
 # Import artifact capture from conftest
@@ -19,6 +29,55 @@ except ImportError:
     HTML_DIR = ARTIFACTS_DIR / "html"
     artifact_capture = None
 
+# Screenshot encoding: PNG by default; ARTIFACT_FAST=1 switches to JPEG, which
+# encodes far faster than a fully compressed PNG at the cost of lossless output
+ARTIFACT_FAST = os.getenv("ARTIFACT_FAST", "0") == "1"
+if ARTIFACT_FAST:
+    SCREENSHOT_EXT = "jpg"
+    SCREENSHOT_OPTIONS: Dict[str, Any] = {"type": "jpeg", "quality": 60, "scale": "css", "caret": "initial"}
+else:
+    SCREENSHOT_EXT = "png"
+    SCREENSHOT_OPTIONS = {"type": "png", "scale": "css", "caret": "initial"}
+
+# Artifact filename stamps: one wall-clock read per session, then a counter
+_SESSION_TS = int(time.time())
+_CAPTURE_SEQ = itertools.count()
+
+# Capture-path logging; records are only enqueued once start_artifact_logging() runs
+logger = logging.getLogger("qa.artifacts")
+_log_listener: Optional[QueueListener] = None
+
+
+def start_artifact_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Route ``qa.artifacts`` records through a queue drained by a background thread.
+    
+    Args:
+        level: Minimum level to emit; lower-level records are never formatted
+        
+    Returns:
+        The running queue listener (idempotent across calls)
+    """
+    global _log_listener
+    if _log_listener is None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(level)
+        logger.propagate = False
+        _log_listener = QueueListener(log_queue, stream_handler)
+        _log_listener.start()
+    return _log_listener
+
+
+def stop_artifact_logging():
+    """Flush pending ``qa.artifacts`` records and stop the listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 
 def capture_failure_artifacts(page: Page, test_name: str, error_type: str = "failure") -> Dict[str, str]:
     """
@@ -32,38 +91,149 @@ def capture_failure_artifacts(page: Page, test_name: str, error_type: str = "fai
     Returns:
         Dictionary with paths to captured artifacts
     """
-    timestamp = int(time.time())
+    # Session start time plus a sequence number keeps back-to-back captures unique
+    timestamp = f"{_SESSION_TS}_{next(_CAPTURE_SEQ)}"
     artifacts = {}
     
-    # Create test-specific directory
-    test_dir = ARTIFACTS_DIR / _sanitize_test_name(test_name)
-    test_dir.mkdir(exist_ok=True)
-    (test_dir / "screenshots").mkdir(exist_ok=True)
-    (test_dir / "html").mkdir(exist_ok=True)
+    test_dir = _prepare_test_dir(test_name)
+    
+    # Grab both payloads from the browser first, then write them in one batch
+    pending: Dict[str, Tuple[Path, bytes]] = {}
     
     # Capture screenshot
     try:
-        screenshot_path = test_dir / "screenshots" / f"{error_type}_{timestamp}.png"
-        page.screenshot(path=str(screenshot_path))
-        artifacts["screenshot"] = str(screenshot_path.relative_to(ARTIFACTS_DIR.parent))
+        screenshot_path = test_dir / "screenshots" / f"{error_type}_{timestamp}.{SCREENSHOT_EXT}"
+        pending["screenshot"] = (screenshot_path, page.screenshot(**SCREENSHOT_OPTIONS))
     except Exception as e:
-        print(f"Failed to capture screenshot: {e}")
+        logger.warning("Failed to capture screenshot: %s", e)
         artifacts["screenshot"] = None
     
     # Capture HTML snapshot
     try:
         html_path = test_dir / "html" / f"{error_type}_{timestamp}.html"
-        html_content = page.content()
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        artifacts["html_snapshot"] = str(html_path.relative_to(ARTIFACTS_DIR.parent))
+        pending["html_snapshot"] = (html_path, page.content().encode("utf-8"))
     except Exception as e:
-        print(f"Failed to capture HTML snapshot: {e}")
+        logger.warning("Failed to capture HTML snapshot: %s", e)
         artifacts["html_snapshot"] = None
     
+    artifacts.update(_write_artifact_files(pending))
     return artifacts
 
 
+def _write_artifact_files(pending: Dict[str, Tuple[Path, bytes]]) -> Dict[str, Optional[str]]:
+    """
+    Queue captured artifact payloads for the background writer.
+    
+    Args:
+        pending: Mapping of artifact key to (destination path, payload bytes)
+        
+    Returns:
+        Mapping of artifact key to its path relative to the QA directory
+    """
+    written = {}
+    for key, (path, data) in pending.items():
+        _artifact_writer.submit(path, data)
+        written[key] = _relative_artifact_path(path)
+    return written
+
+
+def _relative_artifact_path(path: Path) -> str:
+    """Path of an artifact relative to the QA directory, as reported to callers."""
+    return str(path.relative_to(ARTIFACTS_DIR.parent))
+
+
+class _ArtifactWriter:
+    """Writes artifact payloads on a daemon thread so captures don't block on disk I/O."""
+    
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._failed: set = set()
+    
+    def submit(self, path: Path, data: bytes):
+        """Queue a payload to be written to path."""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                    self._thread.start()
+        self._queue.put((path, data))
+    
+    def flush(self) -> set:
+        """Block until every queued payload has been written; return the paths that failed."""
+        self._queue.join()
+        with self._lock:
+            return set(self._failed)
+    
+    def _run(self):
+        while True:
+            path, data = self._queue.get()
+            try:
+                _write_fully(path, data)
+            except Exception as e:
+                # Any exception escaping here would kill the thread and hang flush()
+                logger.warning("Failed to write %s: %s", path, e)
+                self._discard(path)
+            finally:
+                self._queue.task_done()
+    
+    def _discard(self, path: Path):
+        """Remove a partially written file and remember the path as failed."""
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        try:
+            failed_path = _relative_artifact_path(path)
+        except ValueError:
+            failed_path = str(path)
+        with self._lock:
+            self._failed.add(failed_path)
+
+
+_artifact_writer = _ArtifactWriter()
+atexit.register(_artifact_writer.flush)
+
+
+def flush_artifact_writes() -> set:
+    """
+    Wait for all queued artifact files to reach disk.
+    
+    Returns:
+        Paths (as returned by the capture helpers) whose write failed
+    """
+    return _artifact_writer.flush()
+
+
+def _write_fully(path: Path, data: bytes):
+    """Write bytes with raw os.write calls, skipping the buffered file object layer."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=128)
+def _prepare_test_dir(test_name: str) -> Path:
+    """
+    Create the per-test artifact directories once per session.
+    
+    Args:
+        test_name: Name of the test for artifact organization
+        
+    Returns:
+        Path to the test's artifact directory
+    """
+    test_dir = ARTIFACTS_DIR / _sanitize_test_name(test_name)
+    (test_dir / "screenshots").mkdir(parents=True, exist_ok=True)
+    (test_dir / "html").mkdir(exist_ok=True)
+    return test_dir
+
+
 def capture_step_artifacts(page: Page, test_name: str, step_name: str) -> Dict[str, str]:
     """
     Capture artifacts for a specific test step.
@@ -93,9 +263,18 @@ def ensure_artifacts_captured(page: Page, test_name: str, error_type: str = "fai
     """
     artifacts = capture_failure_artifacts(page, test_name, error_type)
     
+    # Paths come back before the background write lands; drop any that failed
+    failed = flush_artifact_writes()
+    for key, path in artifacts.items():
+        if path in failed:
+            artifacts[key] = None
+    
+    if artifacts.get("screenshot") and artifacts.get("html_snapshot"):
+        return artifacts
+    
     # Ensure we have at least placeholder paths
     if not artifacts.get("screenshot"):
-        artifacts["screenshot"] = f"artifacts/{test_name}/screenshots/{error_type}_failed.png"
+        artifacts["screenshot"] = f"artifacts/{test_name}/screenshots/{error_type}_failed.{SCREENSHOT_EXT}"
     
     if not artifacts.get("html_snapshot"):
         artifacts["html_snapshot"] = f"artifacts/{test_name}/html/{error_type}_failed.html"
@@ -111,10 +290,14 @@ def log_artifacts_to_console(artifacts: Dict[str, str], prefix: str = ""):
         artifacts: Dictionary of artifact paths
         prefix: Optional prefix for log messages
     """
+    lines = []
     if artifacts.get("screenshot"):
-        print(f"{prefix}Screenshot: {artifacts['screenshot']}")
+        lines.append(f"{prefix}Screenshot: {artifacts['screenshot']}")
     if artifacts.get("html_snapshot"):
-        print(f"{prefix}HTML Snapshot: {artifacts['html_snapshot']}")
+        lines.append(f"{prefix}HTML Snapshot: {artifacts['html_snapshot']}")
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def get_artifact_summary(test_name: str) -> Dict[str, Any]:
@@ -127,48 +310,73 @@ def get_artifact_summary(test_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary with artifact summary
     """
-    test_dir = ARTIFACTS_DIR / _sanitize_test_name(test_name)
+    # Only list files whose background write has finished
+    flush_artifact_writes()
     
-    if not test_dir.exists():
-        return {"test_name": test_name, "artifacts": [], "total_count": 0}
+    test_dir = ARTIFACTS_DIR / _sanitize_test_name(test_name)
+    relative_dir = test_dir.relative_to(ARTIFACTS_DIR.parent)
     
     artifacts = []
-    total_count = 0
-    
-    # Scan screenshots
-    screenshots_dir = test_dir / "screenshots"
-    if screenshots_dir.exists():
-        for screenshot in screenshots_dir.glob("*.png"):
-            artifacts.append({
-                "type": "screenshot",
-                "path": str(screenshot.relative_to(ARTIFACTS_DIR.parent)),
-                "size": screenshot.stat().st_size if screenshot.exists() else 0,
-                "timestamp": screenshot.stat().st_mtime if screenshot.exists() else 0
-            })
-            total_count += 1
-    
-    # Scan HTML snapshots
-    html_dir = test_dir / "html"
-    if html_dir.exists():
-        for html_file in html_dir.glob("*.html"):
-            artifacts.append({
-                "type": "html_snapshot",
-                "path": str(html_file.relative_to(ARTIFACTS_DIR.parent)),
-                "size": html_file.stat().st_size if html_file.exists() else 0,
-                "timestamp": html_file.stat().st_mtime if html_file.exists() else 0
-            })
-            total_count += 1
+    for subdir, artifact_type, suffixes in (
+        ("screenshots", "screenshot", (".png", ".jpg")),
+        ("html", "html_snapshot", (".html",)),
+    ):
+        artifacts.extend(_scan_artifacts(test_dir / subdir, relative_dir / subdir, artifact_type, suffixes))
     
     return {
         "test_name": test_name,
         "artifacts": artifacts,
-        "total_count": total_count
+        "total_count": len(artifacts)
     }
 
 
+def _scan_artifacts(directory: Path, relative_dir: Path, artifact_type: str,
+                    suffixes: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """List artifact files in one directory pass, statting each entry once."""
+    found = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(suffixes) or not entry.is_file():
+                    continue
+                st = entry.stat()
+                found.append({
+                    "type": artifact_type,
+                    "path": str(relative_dir / entry.name),
+                    "size": st.st_size,
+                    "timestamp": st.st_mtime
+                })
+    except FileNotFoundError:
+        pass
+    return found
+
+
+_SANITIZE_TABLE = str.maketrans({'/': '_', '\\': '_', ':': '_'})
+
+
+@functools.lru_cache(maxsize=4096)
 def _sanitize_test_name(test_name: str) -> str:
     """Sanitize test name for use as directory name."""
-    return test_name.replace('/', '_').replace('\\', '_').replace(':', '_')
+    return test_name.translate(_SANITIZE_TABLE)
+
+
+_REPORT_RULE = "=" * 80
+_REPORT_HEADER = (
+    f"{_REPORT_RULE}\n"
+    "ARTIFACT CAPTURE REPORT\n"
+    f"{_REPORT_RULE}\n"
+    "Generated: {generated}\n"
+    "Artifacts Directory: {artifacts_dir}\n"
+    "\n"
+)
+_REPORT_FOOTER = (
+    "\n"
+    "To view artifacts in CI:\n"
+    "1. Download the artifacts directory from CI\n"
+    "2. Open HTML files in a web browser\n"
+    "3. View PNG screenshots with any image viewer\n"
+    f"{_REPORT_RULE}"
+)
 
 
 def create_artifact_report(test_names: list) -> str:
@@ -181,39 +389,46 @@ def create_artifact_report(test_names: list) -> str:
     Returns:
         Formatted report string
     """
-    report_lines = []
-    report_lines.append("=" * 80)
-    report_lines.append("ARTIFACT CAPTURE REPORT")
-    report_lines.append("=" * 80)
-    report_lines.append(f"Generated: {datetime.now().isoformat()}")
-    report_lines.append(f"Artifacts Directory: {ARTIFACTS_DIR}")
-    report_lines.append("")
+    # Make sure captures still in flight show up in the report
+    failed = flush_artifact_writes()
+    
+    buf = io.StringIO()
+    buf.write(_REPORT_HEADER.format(generated=datetime.now().isoformat(), artifacts_dir=ARTIFACTS_DIR))
     
     total_artifacts = 0
     
-    for test_name in test_names:
-        summary = get_artifact_summary(test_name)
-        report_lines.append(f"Test: {test_name}")
-        report_lines.append(f"  Total Artifacts: {summary['total_count']}")
+    for test_name, summary in zip(test_names, _collect_summaries(test_names)):
+        buf.write(f"Test: {test_name}\n  Total Artifacts: {summary['total_count']}\n")
         
         if summary['artifacts']:
             for artifact in summary['artifacts']:
-                report_lines.append(f"    {artifact['type']}: {artifact['path']}")
+                buf.write(f"    {artifact['type']}: {artifact['path']}\n")
         else:
-            report_lines.append("    No artifacts captured")
+            buf.write("    No artifacts captured\n")
         
-        report_lines.append("")
+        buf.write("\n")
         total_artifacts += summary['total_count']
     
-    report_lines.append(f"Total Artifacts Across All Tests: {total_artifacts}")
-    report_lines.append("")
-    report_lines.append("To view artifacts in CI:")
-    report_lines.append("1. Download the artifacts directory from CI")
-    report_lines.append("2. Open HTML files in a web browser")
-    report_lines.append("3. View PNG screenshots with any image viewer")
-    report_lines.append("=" * 80)
+    buf.write(f"Total Artifacts Across All Tests: {total_artifacts}\n")
+    
+    if failed:
+        buf.write(f"Failed Artifact Writes: {len(failed)}\n")
+        for path in sorted(failed):
+            buf.write(f"    {path}\n")
+    buf.write(_REPORT_FOOTER)
+    
+    return buf.getvalue()
+
+
+def _collect_summaries(test_names: list) -> List[Dict[str, Any]]:
+    """Gather artifact summaries, scanning test directories concurrently when there are several."""
+    if len(test_names) < 2:
+        return [get_artifact_summary(test_name) for test_name in test_names]
     
-    return "\n".join(report_lines)
+    # Directory scans release the GIL, so threads overlap the filesystem calls
+    max_workers = min(32, len(test_names), (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(get_artifact_summary, test_names))
 
 
 def save_artifact_report(test_names: list, output_path: Optional[Path] = None) -> Path:
@@ -232,7 +447,6 @@ def save_artifact_report(test_names: list, output_path: Optional[Path] = None) -
     
     report_content = create_artifact_report(test_names)
     
-    with open(output_path, 'w') as f:
-        f.write(report_content)
+    Path(output_path).write_text(report_content, encoding='utf-8')
     
     return output_path
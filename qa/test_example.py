@@ -12,12 +12,27 @@ from pathlib import Path
 qa_dir = Path(__file__).parent
 sys.path.insert(0, str(qa_dir))
 
+from concurrent.futures import ThreadPoolExecutor
+
+import run_browser_tests
 from run_browser_tests import BrowserTestRunner
 from playwright.sync_api import Page
 
+# Real VINs for the decoder check, paired with their decode paths once
+TEST_VINS = (
+    "1HGBH41JXMN109186",  # Honda Civic
+    "5NPE34AF4FH012345",  # Hyundai Sonata
+    "WBA3B5C50FD123456"   # BMW 3 Series
+)
+VIN_DECODE_PATHS = tuple((vin, f"/vehicle/decode/{vin}") for vin in TEST_VINS)
+
 class CustomTestRunner(BrowserTestRunner):
     """Custom test runner with additional test scenarios."""
     
+    BASE_URL = run_browser_tests.BASE_URL
+    HEADLESS = run_browser_tests.HEADLESS
+    TIMEOUT = run_browser_tests.TIMEOUT
+    
     def test_custom_scenarios(self, page: Page):
         """Test custom scenarios specific to your application."""
         print("\n=== Testing Custom Scenarios ===")
@@ -27,16 +42,16 @@ class CustomTestRunner(BrowserTestRunner):
         
         # Test form interaction
         try:
-            # Look for form fields and fill them
-            title_field = page.locator('input[name="title"], input[placeholder*="title"], input[placeholder*="Title"]')
-            if title_field.count() > 0:
-                title_field.first.fill("Custom Test Inspection")
+            # Look for form fields and fill them (one element lookup each)
+            title_field = page.query_selector('input[name="title"], input[placeholder*="title"], input[placeholder*="Title"]')
+            if title_field:
+                title_field.fill("Custom Test Inspection")
                 print("✅ Filled title field")
             
             # Test form submission
-            submit_button = page.locator('button[type="submit"], input[type="submit"], button:has-text("Submit"), button:has-text("Create")')
-            if submit_button.count() > 0:
-                submit_button.first.click()
+            submit_button = page.query_selector('button[type="submit"], input[type="submit"], button:has-text("Submit"), button:has-text("Create")')
+            if submit_button:
+                submit_button.click()
                 self.wait_for_network_idle(page)
                 print("✅ Submitted form")
                 
@@ -47,27 +62,29 @@ class CustomTestRunner(BrowserTestRunner):
         """Test specific API endpoints."""
         print("\n=== Testing API Endpoints ===")
         
-        # Test VIN decoder with a real VIN
-        test_vins = [
-            "1HGBH41JXMN109186",  # Honda Civic
-            "5NPE34AF4FH012345",  # Hyundai Sonata
-            "WBA3B5C50FD123456"   # BMW 3 Series
-        ]
-        
-        for vin in test_vins:
+        def decode(path):
             try:
-                response = page.request.get(f"{self.BASE_URL}/vehicle/decode/{vin}")
-                if response.status == 200:
-                    data = response.json()
-                    print(f"✅ VIN {vin} decoded successfully: {data.get('make', 'Unknown')} {data.get('model', 'Unknown')}")
-                else:
-                    self.log_error("vehicle-service", "API_ERROR", 
-                                  f"VIN decoder failed for {vin}: {response.status}", 
-                                  f"{self.BASE_URL}/vehicle/decode/{vin}")
+                response = self.http.get(path)
+                data = response.json() if response.status_code == 200 else None
+                return response, data, None
             except Exception as e:
+                return None, None, e
+        
+        # Fire all decodes at once over the shared keep-alive client
+        with ThreadPoolExecutor(max_workers=len(VIN_DECODE_PATHS)) as executor:
+            results = list(executor.map(decode, (path for _, path in VIN_DECODE_PATHS)))
+        
+        for (vin, path), (response, data, error) in zip(VIN_DECODE_PATHS, results):
+            if error is not None:
                 self.log_error("vehicle-service", "API_ERROR", 
-                              f"VIN decoder exception for {vin}: {str(e)}", 
-                              f"{self.BASE_URL}/vehicle/decode/{vin}")
+                              f"VIN decoder exception for {vin}: {str(error)}", 
+                              f"{self.BASE_URL}{path}")
+            elif response.status_code == 200:
+                print(f"✅ VIN {vin} decoded successfully: {data.get('make', 'Unknown')} {data.get('model', 'Unknown')}")
+            else:
+                self.log_error("vehicle-service", "API_ERROR", 
+                              f"VIN decoder failed for {vin}: {response.status_code}", 
+                              f"{self.BASE_URL}{path}")
     
     def run_tests(self):
         """Override the main test runner to include custom tests."""
@@ -102,6 +119,7 @@ class CustomTestRunner(BrowserTestRunner):
             
             finally:
                 browser.close()
+                self.close()
         
         # Save error logs
         self.save_error_logs()
@@ -112,11 +130,7 @@ class CustomTestRunner(BrowserTestRunner):
         
         if self.errors:
             print("\nErrors by service:")
-            service_counts = {}
-            for error in self.errors:
-                service_counts[error.service] = service_counts.get(error.service, 0) + 1
-            
-            for service, count in sorted(service_counts.items()):
+            for service, count in sorted(self._service_counts.items()):
                 print(f"  {service}: {count} errors")
         
         return len(self.errors) == 0
@@ -3,17 +3,45 @@
 Unit tests for health check functionality.
 """
 
+import asyncio
 import os
 import sys
 import time
 import unittest
-from unittest.mock import patch, MagicMock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 import httpx
 
 # Add the qa directory to the path so we can import health_check
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from health_check import get_base_url, check_health, wait_for_health
+from health_check import (
+    get_base_url, check_health, wait_for_health,
+    check_health_async, wait_for_all_healthy
+)
+
+class FakeResponse:
+    """Minimal stand-in for httpx.Response."""
+    
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+    
+    def json(self):
+        return self._payload
+
+class FakeClient:
+    """Minimal stand-in for httpx.Client that returns or raises a fixed result."""
+    
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+    
+    def get(self, url, **kwargs):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
 
 class TestHealthCheck(unittest.TestCase):
     """Test cases for health check functionality."""
@@ -31,156 +59,142 @@ class TestHealthCheck(unittest.TestCase):
             url = get_base_url()
             self.assertEqual(url, test_url)
     
-    @patch('httpx.Client')
-    def test_check_health_success(self, mock_client):
+    def test_check_health_success(self):
         """Test that check_health returns True when service is healthy."""
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "ok"}
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value = mock_client_instance
+        client = FakeClient(FakeResponse(200, {"status": "ok"}))
         
-        result = check_health("http://test-server:8000")
+        result = check_health("http://test-server:8000", client=client)
         self.assertTrue(result)
     
-    @patch('httpx.Client')
-    def test_check_health_failure_status_code(self, mock_client):
+    def test_check_health_failure_status_code(self):
         """Test that check_health returns False when service returns non-200 status."""
-        # Mock failed response
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value = mock_client_instance
+        client = FakeClient(FakeResponse(500))
         
-        result = check_health("http://test-server:8000")
+        result = check_health("http://test-server:8000", client=client)
         self.assertFalse(result)
     
-    @patch('httpx.Client')
-    def test_check_health_failure_wrong_status(self, mock_client):
+    def test_check_health_failure_wrong_status(self):
         """Test that check_health returns False when service returns wrong status."""
-        # Mock response with wrong status
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "error"}
+        client = FakeClient(FakeResponse(200, {"status": "error"}))
         
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value = mock_client_instance
-        
-        result = check_health("http://test-server:8000")
+        result = check_health("http://test-server:8000", client=client)
         self.assertFalse(result)
     
-    @patch('httpx.Client')
-    def test_check_health_connection_error(self, mock_client):
+    def test_check_health_connection_error(self):
         """Test that check_health returns False when connection fails."""
-        # Mock connection error
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.get.side_effect = httpx.RequestError("Connection failed")
-        mock_client.return_value = mock_client_instance
+        client = FakeClient(httpx.RequestError("Connection failed"))
         
-        result = check_health("http://test-server:8000")
+        result = check_health("http://test-server:8000", client=client)
         self.assertFalse(result)
     
-    @patch('httpx.Client')
     @patch('time.sleep')
-    def test_wait_for_health_success(self, mock_sleep, mock_client):
+    def test_wait_for_health_success(self, mock_sleep):
         """Test that wait_for_health returns True when service becomes healthy."""
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "ok"}
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value = mock_client_instance
+        client = FakeClient(FakeResponse(200, {"status": "ok"}))
         
         # Use a short timeout to make the test fast
-        result = wait_for_health("http://test-server:8000", timeout=1)
+        result = wait_for_health("http://test-server:8000", timeout=1, client=client)
         
         self.assertTrue(result)
-        self.assertGreaterEqual(mock_client_instance.get.call_count, 1)
+        self.assertGreaterEqual(client.calls, 1)
         # If health check succeeds immediately, sleep might not be called
         # This is expected behavior
     
-    @patch('httpx.Client')
     @patch('time.sleep')
-    def test_wait_for_health_timeout(self, mock_sleep, mock_client):
+    def test_wait_for_health_timeout(self, mock_sleep):
         """Test that wait_for_health returns False when timeout is reached."""
-        # Mock connection error to simulate failure
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.get.side_effect = httpx.RequestError("Connection failed")
-        mock_client.return_value = mock_client_instance
+        client = FakeClient(httpx.RequestError("Connection failed"))
         
         # Use a very short timeout to make the test fast
-        result = wait_for_health("http://test-server:8000", timeout=0.1)
+        result = wait_for_health("http://test-server:8000", timeout=0.1, client=client)
         
         self.assertFalse(result)
         # Should have called the client at least once
-        self.assertGreaterEqual(mock_client_instance.get.call_count, 1)
+        self.assertGreaterEqual(client.calls, 1)
     
-    @patch('httpx.Client')
     @patch('time.sleep')
-    def test_wait_for_health_exponential_backoff(self, mock_sleep, mock_client):
+    def test_wait_for_health_exponential_backoff(self, mock_sleep):
         """Test that wait_for_health uses exponential backoff."""
-        # Mock connection error to simulate failure
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value = mock_client_instance
-        mock_client_instance.__exit__.return_value = None
-        mock_client_instance.get.side_effect = httpx.RequestError("Connection failed")
-        mock_client.return_value = mock_client_instance
+        client = FakeClient(httpx.RequestError("Connection failed"))
         
         # Use a short timeout to make the test fast
-        result = wait_for_health("http://test-server:8000", timeout=0.5, initial_delay=0.1)
+        result = wait_for_health(
+            "http://test-server:8000", timeout=0.5, initial_delay=0.1, client=client
+        )
         
         self.assertFalse(result)
         # Should have slept with increasing delays (capped at max_delay)
         # With initial_delay=0.1, backoff_factor=2.0, max_delay=10.0:
-        # 0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4, 10.0 (capped)
+        # 0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4, 10.0 (capped), each +/- 20% jitter
         expected_sleep_calls = [0.1, 0.2, 0.4, 0.8]  # First few delays
         actual_sleep_calls = [call[0][0] for call in mock_sleep.call_args_list]
         # Check that we have at least the expected number of calls
         self.assertGreaterEqual(len(actual_sleep_calls), len(expected_sleep_calls))
-        # Check that the first few calls match expected values
+        # Check that the first few calls stay within the jitter bounds
         for i, expected in enumerate(expected_sleep_calls):
             if i < len(actual_sleep_calls):
-                self.assertAlmostEqual(actual_sleep_calls[i], expected, places=1)
+                self.assertGreaterEqual(actual_sleep_calls[i], expected * 0.8)
+                self.assertLessEqual(actual_sleep_calls[i], expected * 1.2)
+
+class TestHealthCheckAsync(unittest.TestCase):
+    """Test cases for concurrent multi-service health checks."""
+    
+    @staticmethod
+    def _client(healthy_hosts):
+        """Build an AsyncClient whose transport reports only healthy_hosts as ok."""
+        def handler(request):
+            status = "ok" if request.url.host in healthy_hosts else "starting"
+            return httpx.Response(200, json={"status": status})
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    
+    @staticmethod
+    def _run(coro):
+        """Run coro on a fresh loop in a worker thread.
+        
+        The Playwright sync fixtures leave an event loop running on the main
+        thread for the rest of the session, which makes asyncio.run() fail there.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+    
+    def test_check_health_async_preserves_order(self):
+        """Test that check_health_async returns one result per URL, in order."""
+        async def run():
+            async with self._client({"a"}) as client:
+                return await check_health_async(["http://a:8000", "http://b:8000"], client)
+        
+        self.assertEqual(self._run(run()), [True, False])
+    
+    def test_wait_for_all_healthy_success(self):
+        """Test that wait_for_all_healthy returns True when every service is healthy."""
+        async def run():
+            async with self._client({"a", "b"}) as client:
+                return await wait_for_all_healthy(
+                    ["http://a:8000", "http://b:8000"], timeout=1, client=client
+                )
+        
+        self.assertTrue(self._run(run()))
+    
+    def test_wait_for_all_healthy_timeout(self):
+        """Test that wait_for_all_healthy returns False if any service stays unhealthy."""
+        async def run():
+            async with self._client({"a"}) as client:
+                return await wait_for_all_healthy(
+                    ["http://a:8000", "http://b:8000"],
+                    timeout=0.1, initial_delay=0.01, client=client
+                )
+        
+        self.assertFalse(self._run(run()))
 
 class TestHealthCheckIntegration(unittest.TestCase):
     """Integration tests for health check functionality."""
     
+    @unittest.skipUnless(os.getenv("RUN_INTEGRATION") == "1", "set RUN_INTEGRATION=1 to run")
     def test_health_check_with_real_server(self):
-        """Test health check with a real running server (if available)."""
-        # Skip this test if no server is running to avoid connection errors
-        try:
-            result = check_health()
-            # If server is running, it should return True
-            # If server is not running, it should return False
-            # Both are valid outcomes for this test
-            self.assertIsInstance(result, bool)
-        except Exception as e:
-            # Skip the test if there's a connection error (server not running)
-            if "Connection" in str(e) or "Name resolution" in str(e):
-                self.skipTest(f"Server not running, skipping integration test: {e}")
-            else:
-                # If there's an unexpected error, that's a test failure
-                self.fail(f"Unexpected error during health check: {e}")
+        """Test health check with a real running server."""
+        # check_health swallows connection errors, so a stopped server yields False
+        result = check_health()
+        self.assertIsInstance(result, bool)
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,6 +4,7 @@ Test helpers for Playwright browser tests.
 Provides utilities to prevent and detect goto method shadowing.
 """
 
+import functools
 import os
 from typing import Optional
 from playwright.sync_api import Page
@@ -22,11 +23,12 @@ def verify_page_goto_callable(page: Page) -> bool:
     Raises:
         AssertionError: If page.goto is not callable
     """
-    if not hasattr(page, 'goto'):
+    goto = getattr(page, 'goto', None)
+    if goto is None:
         raise AssertionError("Page object does not have 'goto' attribute")
     
-    if not callable(page.goto):
-        raise AssertionError(f"Page.goto is not callable. Type: {type(page.goto)}")
+    if not callable(goto):
+        raise AssertionError(f"Page.goto is not callable. Type: {type(goto)}")
     
     return True
 
@@ -57,8 +59,9 @@ def safe_navigate(page: Page, url: str, timeout: Optional[int] = None) -> bool:
         return False
 
 
+@functools.cache
 def get_base_url() -> str:
-    """Get the base URL from environment variables."""
+    """Get the base URL from environment variables (resolved once per run)."""
     from app.config.runtime import BASE_URL
     return BASE_URL
 
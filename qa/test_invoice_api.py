@@ -4,7 +4,9 @@ Smoke test for the canonical invoice API endpoint.
 Tests POST /api/invoices with minimal valid payload.
 """
 
+import functools
 import json
+import os
 import requests
 import sys
 from datetime import date, datetime, timedelta
@@ -14,8 +16,20 @@ from typing import Dict, Any
 BASE_URL = "http://localhost:8000"
 API_ENDPOINT = f"{BASE_URL}/api/invoices"
 
+# Set SMOKE_VERBOSE=1 to print payloads, headers and pretty-printed responses
+VERBOSE = os.getenv("SMOKE_VERBOSE") == "1"
+
+# One pooled session so every request reuses the same keep-alive connection
+SESSION = requests.Session()
+SESSION.headers.update({"Content-Type": "application/json"})
+
+def _dump(data: Any) -> str:
+    """Render JSON for console output, pretty-printed only in verbose mode."""
+    return json.dumps(data, indent=2) if VERBOSE else json.dumps(data)
+
+@functools.lru_cache(maxsize=1)
 def create_test_client() -> str:
-    """Create a test client and return its ID."""
+    """Create a test client once per run and return its ID."""
     client_data = {
         "name": "Test Client",
         "company": "Test Company",
@@ -32,7 +46,7 @@ def create_test_client() -> str:
         }
     }
     
-    response = requests.post(f"{BASE_URL}/invoices/api/clients", json=client_data)
+    response = SESSION.post(f"{BASE_URL}/invoices/api/clients", json=client_data)
     if response.status_code == 201 or response.status_code == 200:
         return response.json().get("client_id")
     else:
@@ -64,20 +78,18 @@ def test_canonical_invoice_endpoint() -> bool:
     
     try:
         print(f"  📤 Sending POST request to {API_ENDPOINT}")
-        print(f"  📋 Payload: {json.dumps(test_payload, indent=2)}")
+        if VERBOSE:
+            print(f"  📋 Payload: {_dump(test_payload)}")
         
-        response = requests.post(
-            API_ENDPOINT,
-            json=test_payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = SESSION.post(API_ENDPOINT, json=test_payload)
         
         print(f"  📥 Response Status: {response.status_code}")
-        print(f"  📥 Response Headers: {dict(response.headers)}")
+        if VERBOSE:
+            print(f"  📥 Response Headers: {dict(response.headers)}")
         
         if response.status_code in [200, 201]:
             response_data = response.json()
-            print(f"  ✅ Success! Response: {json.dumps(response_data, indent=2)}")
+            print(f"  ✅ Success! Response: {_dump(response_data)}")
             
             # Verify response structure
             if "invoice_id" in response_data:
@@ -125,17 +137,13 @@ def test_backward_compatibility() -> bool:
         old_endpoint = f"{BASE_URL}/invoices/api/invoices"
         print(f"  📤 Sending POST request to {old_endpoint}")
         
-        response = requests.post(
-            old_endpoint,
-            json=test_payload,
-            headers={"Content-Type": "application/json"}
-        )
+        response = SESSION.post(old_endpoint, json=test_payload)
         
         print(f"  📥 Response Status: {response.status_code}")
         
         if response.status_code == 201 or response.status_code == 200:
             response_data = response.json()
-            print(f"  ✅ Backward compatibility maintained! Response: {json.dumps(response_data, indent=2)}")
+            print(f"  ✅ Backward compatibility maintained! Response: {_dump(response_data)}")
             return True
         else:
             print(f"  ❌ Backward compatibility broken! Status: {response.status_code}")
@@ -150,11 +158,14 @@ def main():
     """Run all tests."""
     print("🚀 Starting Invoice API Smoke Tests\n")
     
-    # Test canonical endpoint
-    canonical_success = test_canonical_invoice_endpoint()
-    
-    # Test backward compatibility
-    backward_success = test_backward_compatibility()
+    try:
+        # Test canonical endpoint
+        canonical_success = test_canonical_invoice_endpoint()
+        
+        # Test backward compatibility
+        backward_success = test_backward_compatibility()
+    finally:
+        SESSION.close()
     
     # Summary
     print("\n📊 Test Summary:")
@@ -3,14 +3,17 @@ Shared configuration settings for all services.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-from pydantic_settings import BaseSettings
-from pydantic import Field
+from typing import Any, List, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic import Field, PrivateAttr
 
 
 class DatabaseSettings(BaseSettings):
     """Database configuration."""
+    model_config = SettingsConfigDict(frozen=True)
+    
     host: str = Field(default="postgres", env="POSTGRES_HOST")
     port: int = Field(default=5432, env="POSTGRES_PORT")
     user: str = Field(default="appuser", env="POSTGRES_USER")
@@ -18,15 +21,33 @@ class DatabaseSettings(BaseSettings):
     database: str = Field(default="appdb", env="POSTGRES_DB")
     schema: str = Field(default="public", env="DB_SCHEMA")
     
+    # Connection pool (pydantic-settings v2 reads env vars through validation_alias)
+    pool_size: int = Field(default=10, validation_alias="DB_POOL_SIZE")
+    max_overflow: int = Field(default=20, validation_alias="DB_MAX_OVERFLOW")
+    pool_timeout: float = Field(default=5.0, validation_alias="DB_POOL_TIMEOUT")
+    pool_recycle: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE")
+    
+    # Prepared statements cached per connection by the asyncpg dialect
+    statement_cache_size: int = Field(default=500, validation_alias="DB_STATEMENT_CACHE_SIZE")
+    
+    _url: str = PrivateAttr()
+    _sync_url: str = PrivateAttr()
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the connection URLs once; the settings are frozen."""
+        credentials = f"{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        self._url = f"postgresql+asyncpg://{credentials}"
+        self._sync_url = f"postgresql://{credentials}"
+    
     @property
     def url(self) -> str:
         """Get database URL."""
-        return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        return self._url
     
     @property
     def sync_url(self) -> str:
         """Get synchronous database URL."""
-        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        return self._sync_url
 
 
 
@@ -35,6 +56,8 @@ class DatabaseSettings(BaseSettings):
 
 class RedisSettings(BaseSettings):
     """Redis configuration."""
+    model_config = SettingsConfigDict(frozen=True)
+    
     url: str = Field(default="redis://redis:6379/0", env="REDIS_URL")
     host: str = Field(default="redis", env="REDIS_HOST")
     port: int = Field(default=6379, env="REDIS_PORT")
@@ -44,6 +67,8 @@ class RedisSettings(BaseSettings):
 
 class ServiceSettings(BaseSettings):
     """Service-specific configuration."""
+    model_config = SettingsConfigDict(frozen=True)
+    
     service_name: str = Field(..., env="SERVICE_NAME")
     service_version: str = Field(default="1.0.0", env="SERVICE_VERSION")
     debug: bool = Field(default=False, env="DEBUG")
@@ -63,6 +88,8 @@ class ServiceSettings(BaseSettings):
 
 class SecuritySettings(BaseSettings):
     """Security configuration."""
+    model_config = SettingsConfigDict(frozen=True)
+    
     cors_origins: List[str] = Field(default=["*"], env="CORS_ORIGINS")
     cors_credentials: bool = Field(default=True, env="CORS_CREDENTIALS")
     cors_methods: List[str] = Field(default=["*"], env="CORS_METHODS")
@@ -76,15 +103,21 @@ class SecuritySettings(BaseSettings):
 
 class Settings(BaseSettings):
     """Main settings class."""
-    database: DatabaseSettings = DatabaseSettings()
-    redis: RedisSettings = RedisSettings()
-    service: ServiceSettings = ServiceSettings()
-    security: SecuritySettings = SecuritySettings()
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    redis: RedisSettings = Field(default_factory=RedisSettings)
+    service: ServiceSettings = Field(default_factory=ServiceSettings)
+    security: SecuritySettings = Field(default_factory=SecuritySettings)
     
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings, parsing the environment only once."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
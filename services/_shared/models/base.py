@@ -4,14 +4,22 @@ Shared base models for all services.
 
 from datetime import datetime
 from typing import Optional
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, func
 from pydantic import BaseModel
 
 
 class TimestampMixin:
-    """Mixin for timestamp fields."""
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    """Mixin for timestamp fields, filled in by the database."""
+    created_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()}
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()}
+    )
 
 
 class BaseResponse(BaseModel):
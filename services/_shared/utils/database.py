@@ -2,7 +2,10 @@
 Shared database utilities for async SQLModel operations.
 """
 
-from typing import AsyncGenerator, Optional
+import os
+import time
+import weakref
+from typing import AsyncGenerator, Iterable, Optional
 from sqlmodel import SQLModel, create_engine, Session
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import AsyncEngine
@@ -15,6 +18,25 @@ from ..config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# How long a successful ping is trusted before hitting the database again
+PING_CACHE_TTL = 0.5
+
+# TimestampMixin columns filled in by a now() server default
+_TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+# Live managers, so a forked worker can detach from its parent's connection pools
+_managers: "weakref.WeakSet[DatabaseManager]" = weakref.WeakSet()
+
+
+def _reset_pools_after_fork() -> None:
+    """Give each forked child fresh pools instead of sockets shared with the parent."""
+    for manager in list(_managers):
+        manager._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
 
 class DatabaseManager:
     """Database manager for async operations."""
@@ -24,6 +46,8 @@ class DatabaseManager:
         self._async_engine: Optional[AsyncEngine] = None
         self._async_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
         self._sync_engine: Optional[Session] = None
+        self._last_ping_ok = float("-inf")
+        _managers.add(self)
     
     @property
     def async_engine(self) -> AsyncEngine:
@@ -33,13 +57,18 @@ class DatabaseManager:
             self._async_engine = create_async_engine(
                 url,
                 pool_pre_ping=True,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=settings.database.pool_size,
+                max_overflow=settings.database.max_overflow,
+                pool_timeout=settings.database.pool_timeout,
+                pool_recycle=settings.database.pool_recycle,
+                pool_use_lifo=True,
                 echo=settings.service.debug,
                 connect_args={
+                    # search_path is sent once per connection at startup
                     "server_settings": {
                         "search_path": self.schema
-                    }
+                    },
+                    "prepared_statement_cache_size": settings.database.statement_cache_size
                 }
             )
         return self._async_engine
@@ -67,21 +96,54 @@ class DatabaseManager:
             )
         return self._sync_engine
     
+    async def _lock_ddl(self, conn) -> None:
+        """Serialize startup DDL for this schema across workers (released at commit)."""
+        await conn.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+            {"key": f"ddl:{self.schema}"}
+        )
+    
     async def create_schema(self) -> None:
         """Create schema if it doesn't exist."""
         async with self.async_engine.begin() as conn:
+            await self._lock_ddl(conn)
             await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {self.schema}"))
             await conn.execute(text(f"SET search_path TO {self.schema}"))
     
+    async def create_extension(self, name: str) -> None:
+        """Create a PostgreSQL extension if it isn't installed yet."""
+        async with self.async_engine.begin() as conn:
+            await self._lock_ddl(conn)
+            await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {name}"))
+    
     async def create_tables(self, models: list[type[SQLModel]]) -> None:
         """Create tables for the given models."""
+        tables = [model.__table__ for model in models]
+        async with self.async_engine.begin() as conn:
+            await self._lock_ddl(conn)
+            await conn.run_sync(SQLModel.metadata.create_all, tables=tables)
+            
+            # create_all skips existing tables, which may predate the server defaults
+            for table in tables:
+                for column in _TIMESTAMP_COLUMNS:
+                    if column in table.c:
+                        await conn.execute(
+                            text(f"ALTER TABLE {table.name} ALTER COLUMN {column} SET DEFAULT now()")
+                        )
+    
+    async def run_ddl(self, statements: Iterable[str]) -> None:
+        """Run idempotent DDL statements, e.g. upgrades for tables that already exist."""
         async with self.async_engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.create_all)
+            await self._lock_ddl(conn)
+            for statement in statements:
+                await conn.execute(text(statement))
     
     async def drop_tables(self, models: list[type[SQLModel]]) -> None:
         """Drop tables for the given models."""
+        tables = [model.__table__ for model in models]
         async with self.async_engine.begin() as conn:
-            await conn.run_sync(SQLModel.metadata.drop_all)
+            await self._lock_ddl(conn)
+            await conn.run_sync(SQLModel.metadata.drop_all, tables=tables)
     
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get async database session."""
@@ -95,9 +157,26 @@ class DatabaseManager:
             finally:
                 await session.close()
     
+    async def ping(self) -> None:
+        """Check database connectivity, raising on failure (successes are cached briefly)."""
+        if time.monotonic() - self._last_ping_ok < PING_CACHE_TTL:
+            return
+        async with self.async_engine.connect() as conn:
+            await conn.scalar(text("SELECT 1"))
+        self._last_ping_ok = time.monotonic()
+    
+    def _reset_after_fork(self) -> None:
+        """Drop pooled connections inherited from the parent process without closing them."""
+        if self._async_engine:
+            self._async_engine.sync_engine.dispose(close=False)
+        if self._sync_engine:
+            self._sync_engine.dispose(close=False)
+        self._last_ping_ok = float("-inf")
+    
     async def close(self) -> None:
         """Close database connections."""
         if self._async_engine:
+            logger.info(f"Closing {self.schema} pool: {self._async_engine.pool.status()}")
             await self._async_engine.dispose()
         if self._sync_engine:
             self._sync_engine.dispose()
@@ -0,0 +1,39 @@
+"""
+Shared logging setup for all services.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def start_queue_logging(level: str, fmt: str = LOG_FORMAT) -> QueueListener:
+    """
+    Route root logging through a queue drained by a background thread.
+    
+    Request handlers only enqueue records, so a slow or blocked stderr
+    (e.g. container log backpressure) never stalls the event loop.
+    
+    Args:
+        level: Root log level name, e.g. "INFO"
+        fmt: Format string for emitted records
+        
+    Returns:
+        The running listener (stopped at interpreter exit, flushing pending records)
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(fmt))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(getattr(logging, level))
+    
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
@@ -6,17 +6,15 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 
 from _shared.config.settings import settings
+from _shared.utils.log_config import start_queue_logging
 from _shared.utils.database import api_gateway_db
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.service.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Configure logging (records are written by a background thread)
+start_queue_logging(settings.service.log_level)
 logger = logging.getLogger(__name__)
 
 
@@ -46,7 +44,8 @@ app = FastAPI(
     title="api-gateway",
     description="Workshop management service",
     version=settings.service.service_version,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -74,8 +73,7 @@ async def readiness_check():
     """Readiness check endpoint."""
     try:
         # Test database connection
-        async with api_gateway_db.async_session_maker() as session:
-            await session.exec("SELECT 1")
+        await api_gateway_db.ping()
         
         return {
             "status": "ready",
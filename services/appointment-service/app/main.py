@@ -10,13 +10,11 @@ from fastapi.responses import JSONResponse
 import logging
 
 from _shared.config.settings import settings
+from _shared.utils.log_config import start_queue_logging
 from _shared.utils.database import appointment_db
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.service.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Configure logging (records are written by a background thread)
+start_queue_logging(settings.service.log_level)
 logger = logging.getLogger(__name__)
 
 
@@ -74,8 +72,7 @@ async def readiness_check():
     """Readiness check endpoint."""
     try:
         # Test database connection
-        async with appointment_db.async_session_maker() as session:
-            await session.exec("SELECT 1")
+        await appointment_db.ping()
         
         return {
             "status": "ready",
@@ -2,58 +2,49 @@
 Customer API routes.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import asyncio
+import hashlib
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
-from _shared.models.base import BaseResponse, PaginationParams
-from app.db.session import get_session
-from app.models.customer import Customer, Address, ContactInfo
+from _shared.models.base import BaseResponse
+from app import cache as customer_cache
+from app.db.session import get_session, get_sessionmaker
+from app.models.customer import Customer
 from app.schemas.customer import (
-    CustomerCreate, CustomerUpdate, CustomerResponse, CustomerListResponse,
-    CustomerDetailResponse, CustomerPaginatedResponse, AddressResponse, ContactInfoResponse
+    CustomerCreate, CustomerUpdate, CustomerResponse,
+    CustomerDetailResponse, CustomerPaginatedResponse
 )
-from app.services.customer_service import CustomerService
+from app.services import customer_service
 
 router = APIRouter(prefix="/v1/customers", tags=["Customers"])
 
 
+def _json_response(model: BaseModel) -> Response:
+    """Serialize an already-validated response model in one pass.
+    
+    Returning a Response directly skips FastAPI's response_model
+    re-validation; the decorator's response_model still documents the shape.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @router.post("/", response_model=CustomerDetailResponse)
 async def create_customer(
     customer_data: CustomerCreate,
     session: AsyncSession = Depends(get_session)
 ):
     """Create a new customer."""
-    customer_service = CustomerService(session)
-    customer = await customer_service.create_customer(customer_data)
+    customer = await customer_service.create_customer(session, customer_data)
     
     return CustomerDetailResponse(
         message="Customer created successfully",
-        data=CustomerResponse(
-            id=customer.id,
-            name=customer.name,
-            company=customer.company,
-            tax_id=customer.tax_id,
-            notes=customer.notes,
-            full_name=customer.full_name,
-            address=AddressResponse(
-                id=customer.address.id,
-                street=customer.address.street,
-                city=customer.address.city,
-                state=customer.address.state,
-                zip_code=customer.address.zip_code,
-                country=customer.address.country
-            ) if customer.address else None,
-            contact=ContactInfoResponse(
-                id=customer.contact.id,
-                phone=customer.contact.phone,
-                email=customer.contact.email,
-                website=customer.contact.website
-            ) if customer.contact else None,
-            created_at=customer.created_at,
-            updated_at=customer.updated_at
-        )
+        data=CustomerResponse.model_validate(customer)
     )
 
 
@@ -62,105 +53,90 @@ async def list_customers(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Page size"),
     search: Optional[str] = Query(None, description="Search term"),
-    session: AsyncSession = Depends(get_session)
+    after_id: Optional[int] = Query(None, description="Cursor: return customers after this ID (overrides page)"),
+    session: AsyncSession = Depends(get_session),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker)
 ):
     """List customers with pagination."""
-    customer_service = CustomerService(session)
     
-    skip = (page - 1) * size
-    customers = await customer_service.get_customers(skip=skip, limit=size, search=search)
-    total = await customer_service.count_customers(search=search)
+    async def count_total() -> int:
+        # A session can't run two queries at once, so count on its own connection
+        async with session_maker() as count_session:
+            return await customer_service.count_customers(count_session, search=search)
     
-    customer_responses = []
-    for customer in customers:
-        customer_responses.append(CustomerResponse(
-            id=customer.id,
-            name=customer.name,
-            company=customer.company,
-            tax_id=customer.tax_id,
-            notes=customer.notes,
-            full_name=customer.full_name,
-            address=AddressResponse(
-                id=customer.address.id,
-                street=customer.address.street,
-                city=customer.address.city,
-                state=customer.address.state,
-                zip_code=customer.address.zip_code,
-                country=customer.address.country
-            ) if customer.address else None,
-            contact=ContactInfoResponse(
-                id=customer.contact.id,
-                phone=customer.contact.phone,
-                email=customer.contact.email,
-                website=customer.contact.website
-            ) if customer.contact else None,
-            created_at=customer.created_at,
-            updated_at=customer.updated_at
+    skip = (page - 1) * size
+    async with asyncio.TaskGroup() as tg:
+        customers_task = tg.create_task(customer_service.get_customers(
+            session, skip=skip, limit=size, search=search, after_id=after_id
         ))
+        total_task = tg.create_task(count_total())
+    customers, total = customers_task.result(), total_task.result()
+    
+    customer_responses = [CustomerResponse.model_validate(customer) for customer in customers]
     
     pages = (total + size - 1) // size
     
-    return CustomerPaginatedResponse(
+    return _json_response(CustomerPaginatedResponse(
         items=customer_responses,
         total=total,
         page=page,
         size=size,
-        pages=pages
-    )
+        pages=pages,
+        next_cursor=customers[-1].id if len(customers) == size else None
+    ))
+
+
+def _customer_etag(customer: Customer) -> str:
+    """Build a strong ETag from the customer's identity and last update."""
+    digest = hashlib.blake2b(
+        f"{customer.id}:{customer.updated_at.isoformat()}".encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
 
 
 @router.get("/{customer_id}", response_model=CustomerDetailResponse)
 async def get_customer(
     customer_id: int,
-    session: AsyncSession = Depends(get_session)
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(customer_cache.get_redis)
 ):
-    """Get customer by ID."""
-    customer_service = CustomerService(session)
-    customer = await customer_service.get_customer_by_id(customer_id)
+    """Get customer by ID (served from Redis when cached; 304 when the client's ETag is current)."""
+    cached = await customer_cache.get_cached_customer(redis, customer_id)
+    if cached:
+        etag, body = cached
+    else:
+        customer = await customer_service.get_customer_by_id(session, customer_id)
+        
+        if not customer:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Customer not found"
+            )
+        
+        etag = _customer_etag(customer)
+        body = CustomerDetailResponse(
+            data=CustomerResponse.model_validate(customer)
+        ).model_dump_json().encode()
+        await customer_cache.cache_customer(redis, customer_id, etag, body)
     
-    if not customer:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Customer not found"
-        )
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=5"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
     
-    return CustomerDetailResponse(
-        data=CustomerResponse(
-            id=customer.id,
-            name=customer.name,
-            company=customer.company,
-            tax_id=customer.tax_id,
-            notes=customer.notes,
-            full_name=customer.full_name,
-            address=AddressResponse(
-                id=customer.address.id,
-                street=customer.address.street,
-                city=customer.address.city,
-                state=customer.address.state,
-                zip_code=customer.address.zip_code,
-                country=customer.address.country
-            ) if customer.address else None,
-            contact=ContactInfoResponse(
-                id=customer.contact.id,
-                phone=customer.contact.phone,
-                email=customer.contact.email,
-                website=customer.contact.website
-            ) if customer.contact else None,
-            created_at=customer.created_at,
-            updated_at=customer.updated_at
-        )
-    )
+    return Response(content=body, media_type="application/json", headers=cache_headers)
 
 
 @router.put("/{customer_id}", response_model=CustomerDetailResponse)
 async def update_customer(
     customer_id: int,
     customer_data: CustomerUpdate,
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(customer_cache.get_redis)
 ):
     """Update customer."""
-    customer_service = CustomerService(session)
-    customer = await customer_service.update_customer(customer_id, customer_data)
+    customer = await customer_service.update_customer(session, customer_id, customer_data)
     
     if not customer:
         raise HTTPException(
@@ -168,43 +144,22 @@ async def update_customer(
             detail="Customer not found"
         )
     
+    await customer_cache.invalidate_customer(redis, customer_id)
+    
     return CustomerDetailResponse(
         message="Customer updated successfully",
-        data=CustomerResponse(
-            id=customer.id,
-            name=customer.name,
-            company=customer.company,
-            tax_id=customer.tax_id,
-            notes=customer.notes,
-            full_name=customer.full_name,
-            address=AddressResponse(
-                id=customer.address.id,
-                street=customer.address.street,
-                city=customer.address.city,
-                state=customer.address.state,
-                zip_code=customer.address.zip_code,
-                country=customer.address.country
-            ) if customer.address else None,
-            contact=ContactInfoResponse(
-                id=customer.contact.id,
-                phone=customer.contact.phone,
-                email=customer.contact.email,
-                website=customer.contact.website
-            ) if customer.contact else None,
-            created_at=customer.created_at,
-            updated_at=customer.updated_at
-        )
+        data=CustomerResponse.model_validate(customer)
     )
 
 
 @router.delete("/{customer_id}", response_model=BaseResponse)
 async def delete_customer(
     customer_id: int,
-    session: AsyncSession = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    redis: Redis = Depends(customer_cache.get_redis)
 ):
     """Delete customer."""
-    customer_service = CustomerService(session)
-    success = await customer_service.delete_customer(customer_id)
+    success = await customer_service.delete_customer(session, customer_id)
     
     if not success:
         raise HTTPException(
@@ -212,4 +167,6 @@ async def delete_customer(
             detail="Customer not found"
         )
     
+    await customer_cache.invalidate_customer(redis, customer_id)
+    
     return BaseResponse(message="Customer deleted successfully")
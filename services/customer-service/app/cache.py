@@ -0,0 +1,55 @@
+"""
+Redis read-through cache for customer detail responses.
+"""
+
+import logging
+from typing import Optional, Tuple
+from fastapi import Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached customer response is served before re-reading the database
+CUSTOMER_CACHE_TTL = 60
+
+
+def get_redis(request: Request) -> Redis:
+    """Get the Redis client created at application startup."""
+    return request.app.state.redis
+
+
+def _customer_key(customer_id: int) -> str:
+    """Cache key for a customer's detail response."""
+    return f"customer:{customer_id}"
+
+
+async def get_cached_customer(redis: Redis, customer_id: int) -> Optional[Tuple[str, bytes]]:
+    """Return the cached (etag, body) for a customer, or None on a miss or Redis error."""
+    try:
+        value = await redis.get(_customer_key(customer_id))
+    except RedisError as e:
+        logger.warning(f"Customer cache read failed: {e}")
+        return None
+    
+    if value is None:
+        return None
+    
+    etag, _, body = value.partition(b"\n")
+    return etag.decode(), body
+
+
+async def cache_customer(redis: Redis, customer_id: int, etag: str, body: bytes) -> None:
+    """Store a customer's serialized detail response alongside its ETag."""
+    try:
+        await redis.set(_customer_key(customer_id), etag.encode() + b"\n" + body, ex=CUSTOMER_CACHE_TTL)
+    except RedisError as e:
+        logger.warning(f"Customer cache write failed: {e}")
+
+
+async def invalidate_customer(redis: Redis, customer_id: int) -> None:
+    """Drop a customer's cached response after it changes."""
+    try:
+        await redis.delete(_customer_key(customer_id))
+    except RedisError as e:
+        logger.warning(f"Customer cache invalidation failed: {e}")
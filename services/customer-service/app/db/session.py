@@ -3,12 +3,19 @@ Database session configuration for customer service.
 """
 
 from typing import AsyncGenerator
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from _shared.utils.database import customer_db
 
+def get_sessionmaker(request: Request) -> async_sessionmaker[AsyncSession]:
+    """Get the session factory created at application startup."""
+    return request.app.state.sessionmaker
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session for customer service."""
-    async for session in customer_db.get_session():
+
+async def get_session(
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_sessionmaker)
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get database session for customer service (one per request)."""
+    async with session_maker() as session:
         yield session
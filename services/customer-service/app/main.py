@@ -6,19 +6,18 @@ import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from redis.asyncio import Redis
 import logging
 
 from _shared.config.settings import settings
+from _shared.utils.log_config import start_queue_logging
 from _shared.utils.database import customer_db
-from app.models.customer import Customer, Address, ContactInfo
+from app.models.customer import Customer, Address, ContactInfo, CUSTOMER_UPGRADE_DDL
 from app.api.customers import router as customer_router
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.service.log_level),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Configure logging (records are written by a background thread)
+start_queue_logging(settings.service.log_level)
 logger = logging.getLogger(__name__)
 
 
@@ -31,7 +30,11 @@ async def lifespan(app: FastAPI):
     # Create database schema and tables
     try:
         await customer_db.create_schema()
+        await customer_db.create_extension("pg_trgm")
         await customer_db.create_tables([Customer, Address, ContactInfo])
+        await customer_db.run_ddl(CUSTOMER_UPGRADE_DDL)
+        app.state.sessionmaker = customer_db.async_session_maker
+        app.state.redis = Redis.from_url(settings.redis.url)
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
@@ -41,6 +44,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down customer service...")
+    await app.state.redis.aclose()
     await customer_db.close()
 
 
@@ -49,7 +53,8 @@ app = FastAPI(
     title="Customer Service",
     description="Customer management service",
     version=settings.service.service_version,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -77,8 +82,7 @@ async def readiness_check():
     """Readiness check endpoint."""
     try:
         # Test database connection
-        async with customer_db.async_session_maker() as session:
-            await session.exec("SELECT 1")
+        await customer_db.ping()
         
         return {
             "status": "ready",
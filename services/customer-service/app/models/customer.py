@@ -4,10 +4,17 @@ Customer model for customer service.
 
 from datetime import datetime
 from typing import Optional, List
+from sqlalchemy import Column, Computed, Index, String
 from sqlmodel import SQLModel, Field, Relationship
 
 from _shared.models.base import TimestampMixin
 
+# Expression behind the generated Customer.full_name column
+FULL_NAME_SQL = "CASE WHEN company <> '' THEN name || ' (' || company || ')' ELSE name END"
+
+# Columns matched by the ILIKE customer search
+SEARCH_COLUMNS = ("name", "company", "tax_id")
+
 
 class Address(SQLModel, table=True):
     """Address model."""
@@ -43,24 +50,52 @@ class Customer(SQLModel, TimestampMixin, table=True):
     """Customer model."""
     
     __tablename__ = "customers"
+    __table_args__ = tuple(
+        # Trigram indexes let the substring search use an index scan
+        Index(
+            f"ix_customers_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"}
+        )
+        for column in SEARCH_COLUMNS
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(..., description="Customer name")
     company: Optional[str] = Field(None, description="Company name")
     tax_id: Optional[str] = Field(None, description="Tax ID number")
     notes: Optional[str] = Field(None, description="Additional notes")
+    full_name: Optional[str] = Field(
+        default=None,
+        description="Name with company, maintained by the database",
+        sa_column=Column(
+            String,
+            Computed(FULL_NAME_SQL, persisted=True)
+        )
+    )
     
     # Foreign keys
     address_id: Optional[int] = Field(None, foreign_key="addresses.id")
     contact_id: Optional[int] = Field(None, foreign_key="contact_info.id")
     
-    # Relationships
-    address: Optional[Address] = Relationship(back_populates="customers")
-    contact: Optional[ContactInfo] = Relationship(back_populates="customers")
-    
-    @property
-    def full_name(self) -> str:
-        """Get customer's full name."""
-        if self.company:
-            return f"{self.name} ({self.company})"
-        return self.name
+    # Relationships (must be eager-loaded; lazy access raises instead of querying)
+    address: Optional[Address] = Relationship(
+        back_populates="customers", sa_relationship_kwargs={"lazy": "raise"}
+    )
+    contact: Optional[ContactInfo] = Relationship(
+        back_populates="customers", sa_relationship_kwargs={"lazy": "raise"}
+    )
+
+
+# Idempotent upgrades for tables created before these columns and indexes existed
+# (create_all never alters an existing table)
+CUSTOMER_UPGRADE_DDL = (
+    "ALTER TABLE customers ADD COLUMN IF NOT EXISTS full_name varchar "
+    f"GENERATED ALWAYS AS ({FULL_NAME_SQL}) STORED",
+    *(
+        f"CREATE INDEX IF NOT EXISTS ix_customers_{column}_trgm "
+        f"ON customers USING gin ({column} gin_trgm_ops)"
+        for column in SEARCH_COLUMNS
+    ),
+)
@@ -3,11 +3,14 @@ Customer schemas for request/response DTOs.
 """
 
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field
+from typing import Annotated, Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from _shared.models.base import BaseResponse, PaginationParams, PaginatedResponse
 
+# Structural email check compiled once by pydantic-core (no email-validator pass)
+Email = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)]
+
 
 class AddressCreate(BaseModel):
     """Address creation request."""
@@ -29,6 +32,8 @@ class AddressUpdate(BaseModel):
 
 class AddressResponse(BaseModel):
     """Address response."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     street: str
     city: str
@@ -40,19 +45,21 @@ class AddressResponse(BaseModel):
 class ContactInfoCreate(BaseModel):
     """Contact info creation request."""
     phone: Optional[str] = Field(None, description="Phone number")
-    email: Optional[EmailStr] = Field(None, description="Email address")
+    email: Optional[Email] = Field(None, description="Email address")
     website: Optional[str] = Field(None, description="Website URL")
 
 
 class ContactInfoUpdate(BaseModel):
     """Contact info update request."""
     phone: Optional[str] = Field(None, description="Phone number")
-    email: Optional[EmailStr] = Field(None, description="Email address")
+    email: Optional[Email] = Field(None, description="Email address")
     website: Optional[str] = Field(None, description="Website URL")
 
 
 class ContactInfoResponse(BaseModel):
     """Contact info response."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     phone: Optional[str]
     email: Optional[str]
@@ -81,6 +88,8 @@ class CustomerUpdate(BaseModel):
 
 class CustomerResponse(BaseModel):
     """Customer response."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     name: str
     company: Optional[str]
@@ -106,3 +115,4 @@ class CustomerDetailResponse(BaseResponse):
 class CustomerPaginatedResponse(PaginatedResponse):
     """Paginated customer response."""
     items: List[CustomerResponse]
+    next_cursor: Optional[int] = None
@@ -2,158 +2,227 @@
 Customer service business logic.
 """
 
-from datetime import datetime
-from typing import Optional, List
-from sqlmodel import select, and_, or_
+import time
+from typing import Optional, List, Tuple
+from sqlmodel import select, or_, func
 from sqlmodel.ext.asyncio.session import AsyncSession
-from fastapi import HTTPException, status
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import selectinload
 
 from app.models.customer import Customer, Address, ContactInfo
-from app.schemas.customer import CustomerCreate, CustomerUpdate, AddressCreate, ContactInfoCreate
-
-
-class CustomerService:
-    """Customer service."""
-    
-    def __init__(self, session: AsyncSession):
-        self.session = session
-    
-    async def create_customer(self, customer_data: CustomerCreate) -> Customer:
-        """Create a new customer."""
-        # Create address if provided
-        address = None
-        if customer_data.address:
-            address = Address(**customer_data.address.model_dump())
-            self.session.add(address)
-            await self.session.flush()
-        
-        # Create contact info if provided
-        contact = None
-        if customer_data.contact:
-            contact = ContactInfo(**customer_data.contact.model_dump())
-            self.session.add(contact)
-            await self.session.flush()
-        
-        # Create customer
-        customer = Customer(
-            name=customer_data.name,
-            company=customer_data.company,
-            tax_id=customer_data.tax_id,
-            notes=customer_data.notes,
-            address_id=address.id if address else None,
-            contact_id=contact.id if contact else None
-        )
-        
-        self.session.add(customer)
-        await self.session.commit()
-        await self.session.refresh(customer)
-        
-        return customer
-    
-    async def get_customer_by_id(self, customer_id: int) -> Optional[Customer]:
-        """Get customer by ID."""
-        return await self.session.exec(
-            select(Customer)
-            .where(Customer.id == customer_id)
-        ).first()
-    
-    async def get_customers(
-        self, 
-        skip: int = 0, 
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> List[Customer]:
-        """Get customers with optional search."""
-        query = select(Customer)
-        
-        if search:
-            query = query.where(
-                or_(
-                    Customer.name.contains(search),
-                    Customer.company.contains(search),
-                    Customer.tax_id.contains(search)
-                )
-            )
-        
-        return await self.session.exec(
-            query.offset(skip).limit(limit)
-        ).all()
-    
-    async def update_customer(self, customer_id: int, customer_data: CustomerUpdate) -> Optional[Customer]:
-        """Update customer."""
-        customer = await self.get_customer_by_id(customer_id)
-        if not customer:
-            return None
-        
-        # Update customer fields
-        update_data = customer_data.model_dump(exclude_unset=True, exclude={"address", "contact"})
-        for field, value in update_data.items():
-            setattr(customer, field, value)
-        
-        # Update address if provided
-        if customer_data.address:
-            if customer.address_id:
-                # Update existing address
-                address = await self.session.exec(
-                    select(Address).where(Address.id == customer.address_id)
-                ).first()
-                if address:
-                    address_data = customer_data.address.model_dump(exclude_unset=True)
-                    for field, value in address_data.items():
-                        setattr(address, field, value)
-            else:
-                # Create new address
-                address = Address(**customer_data.address.model_dump())
-                self.session.add(address)
-                await self.session.flush()
-                customer.address_id = address.id
-        
-        # Update contact info if provided
-        if customer_data.contact:
-            if customer.contact_id:
-                # Update existing contact
-                contact = await self.session.exec(
-                    select(ContactInfo).where(ContactInfo.id == customer.contact_id)
-                ).first()
-                if contact:
-                    contact_data = customer_data.contact.model_dump(exclude_unset=True)
-                    for field, value in contact_data.items():
-                        setattr(contact, field, value)
-            else:
-                # Create new contact
-                contact = ContactInfo(**customer_data.contact.model_dump())
-                self.session.add(contact)
-                await self.session.flush()
-                customer.contact_id = contact.id
-        
-        customer.updated_at = datetime.utcnow()
-        await self.session.commit()
-        await self.session.refresh(customer)
-        
-        return customer
-    
-    async def delete_customer(self, customer_id: int) -> bool:
-        """Delete customer."""
-        customer = await self.get_customer_by_id(customer_id)
-        if not customer:
-            return False
-        
-        await self.session.delete(customer)
-        await self.session.commit()
-        return True
-    
-    async def count_customers(self, search: Optional[str] = None) -> int:
-        """Count customers with optional search."""
-        query = select(Customer)
-        
-        if search:
-            query = query.where(
-                or_(
-                    Customer.name.contains(search),
-                    Customer.company.contains(search),
-                    Customer.tax_id.contains(search)
-                )
-            )
-        
-        result = await self.session.exec(query)
-        return len(result.all())
+from app.schemas.customer import CustomerCreate, CustomerUpdate
+
+
+# Unfiltered customer total, cached briefly so paging doesn't recount each time
+COUNT_CACHE_TTL = 5.0
+_total_cache: Optional[Tuple[float, int]] = None
+
+# Above this many rows the unfiltered total comes from the planner's estimate
+# (pg_class.reltuples) instead of a full count(*) scan
+ESTIMATED_COUNT_THRESHOLD = 100_000
+
+_ESTIMATED_COUNT = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+)
+
+
+def _invalidate_total() -> None:
+    """Drop the cached unfiltered total after inserts or deletes."""
+    global _total_cache
+    _total_cache = None
+
+
+# Eager-load address and contact so responses never trigger lazy loads
+_RELATIONS = (selectinload(Customer.address), selectinload(Customer.contact))
+
+
+def _with_relations(query):
+    """Apply the customer relation loaders to a query."""
+    return query.options(*_RELATIONS)
+
+
+def _search_filter(search: str):
+    """Build the case-insensitive customer search condition.
+    
+    ILIKE '%...%' is served by the pg_trgm GIN indexes on these columns.
+    All three comparisons share a single bound pattern parameter.
+    """
+    pattern = bindparam("search_pattern", f"%{search}%")
+    return or_(
+        Customer.name.ilike(pattern),
+        Customer.company.ilike(pattern),
+        Customer.tax_id.ilike(pattern)
+    )
+
+
+async def create_customer(session: AsyncSession, customer_data: CustomerCreate) -> Customer:
+    """Create a new customer."""
+    # Address and contact are attached through the relationships, so all
+    # rows are inserted in a single flush at commit (in dependency order).
+    # Unset fields are left out and take the table model's defaults, which
+    # match the request schemas.
+    address = None
+    if customer_data.address:
+        address = Address(**customer_data.address.model_dump(exclude_unset=True))
+    
+    contact = None
+    if customer_data.contact:
+        contact = ContactInfo(**customer_data.contact.model_dump(exclude_unset=True))
+    
+    # Create customer
+    customer = Customer(
+        name=customer_data.name,
+        company=customer_data.company,
+        tax_id=customer_data.tax_id,
+        notes=customer_data.notes,
+        address=address,
+        contact=contact
+    )
+    
+    session.add(customer)
+    await session.commit()
+    _invalidate_total()
+    
+    # No re-read needed: the id, timestamps and full_name come back via
+    # INSERT ... RETURNING, the relations are the objects just created, and
+    # the session doesn't expire attributes on commit
+    return customer
+
+
+async def get_customer_by_id(session: AsyncSession, customer_id: int, refresh: bool = False) -> Optional[Customer]:
+    """Get customer by ID with address and contact loaded.
+    
+    Served from the session's identity map when the customer is already
+    loaded, unless refresh is set.
+    """
+    return await session.get(
+        Customer, customer_id, options=_RELATIONS, populate_existing=refresh
+    )
+
+
+async def get_customers(
+    session: AsyncSession,
+    skip: int = 0, 
+    limit: int = 100,
+    search: Optional[str] = None,
+    after_id: Optional[int] = None
+) -> List[Customer]:
+    """Get customers with optional search.
+    
+    When after_id is given, rows are taken after that id (keyset
+    pagination) and skip is ignored.
+    """
+    query = _with_relations(select(Customer))
+    
+    if search:
+        query = query.where(_search_filter(search))
+    
+    if after_id is not None:
+        query = query.where(Customer.id > after_id)
+    else:
+        query = query.offset(skip)
+    
+    result = await session.exec(
+        query.order_by(Customer.id).limit(limit)
+    )
+    return result.all()
+
+
+async def update_customer(session: AsyncSession, customer_id: int, customer_data: CustomerUpdate) -> Optional[Customer]:
+    """Update customer."""
+    customer = await get_customer_by_id(session, customer_id)
+    if not customer:
+        return None
+    
+    # Update customer fields
+    update_data = customer_data.model_dump(exclude_unset=True, exclude={"address", "contact"})
+    for field, value in update_data.items():
+        setattr(customer, field, value)
+    
+    # Update address if provided
+    if customer_data.address:
+        if customer.address_id:
+            # Update existing address
+            address = customer.address
+            if address:
+                address_data = customer_data.address.model_dump(exclude_unset=True)
+                for field, value in address_data.items():
+                    setattr(address, field, value)
+        else:
+            # Create new address
+            address = Address(**customer_data.address.model_dump(exclude_unset=True))
+            session.add(address)
+            await session.flush()
+            customer.address_id = address.id
+    
+    # Update contact info if provided
+    if customer_data.contact:
+        if customer.contact_id:
+            # Update existing contact
+            contact = customer.contact
+            if contact:
+                contact_data = customer_data.contact.model_dump(exclude_unset=True)
+                for field, value in contact_data.items():
+                    setattr(contact, field, value)
+        else:
+            # Create new contact
+            contact = ContactInfo(**customer_data.contact.model_dump(exclude_unset=True))
+            session.add(contact)
+            await session.flush()
+            customer.contact_id = contact.id
+    
+    # Touch the row even when only the address or contact changed
+    customer.updated_at = func.now()
+    await session.commit()
+    
+    return await get_customer_by_id(session, customer.id, refresh=True)
+
+
+async def delete_customer(session: AsyncSession, customer_id: int) -> bool:
+    """Delete customer."""
+    customer = await get_customer_by_id(session, customer_id)
+    if not customer:
+        return False
+    
+    await session.delete(customer)
+    await session.commit()
+    _invalidate_total()
+    return True
+
+
+async def _estimated_total(session: AsyncSession) -> Optional[int]:
+    """Planner's row estimate for the customers table, or None if unknown."""
+    result = await session.execute(
+        _ESTIMATED_COUNT, {"table_name": Customer.__tablename__}
+    )
+    estimate = result.scalar()
+    # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
+
+
+async def count_customers(session: AsyncSession, search: Optional[str] = None) -> int:
+    """Count customers with optional search.
+    
+    Unfiltered totals are cached briefly, and for large tables are the
+    planner's estimate rather than an exact count.
+    """
+    global _total_cache
+    
+    query = select(func.count()).select_from(Customer)
+    
+    if search:
+        result = await session.exec(query.where(_search_filter(search)))
+        return result.one()
+    
+    if _total_cache is not None and time.monotonic() - _total_cache[0] < COUNT_CACHE_TTL:
+        return _total_cache[1]
+    
+    total = await _estimated_total(session)
+    if total is None or total < ESTIMATED_COUNT_THRESHOLD:
+        result = await session.exec(query)
+        total = result.one()
+    
+    _total_cache = (time.monotonic(), total)
+    return total
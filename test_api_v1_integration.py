@@ -7,8 +7,9 @@ Verifies that all key endpoints exist and return expected responses.
 import asyncio
 import json
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent
@@ -17,17 +18,43 @@ sys.path.insert(0, str(project_root))
 from fastapi.testclient import TestClient
 from main import app
 
+# Shared across runner instances so the app is only wrapped once per process
+_CLIENT: Optional[TestClient] = None
+
+def get_client() -> TestClient:
+    """Return the process-wide TestClient, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = TestClient(app)
+    return _CLIENT
+
+# Endpoint paths exercised by the tests, formatted with _url()
+ENDPOINTS: Dict[str, str] = {
+    "health": "/healthz",
+    "template": "/api/v1/inspection/template",
+    "inspections": "/api/v1/inspection",
+    "inspection": "/api/v1/inspection/{id}",
+    "finalize": "/api/v1/inspection/{id}/finalize",
+    "report": "/api/v1/inspection/{id}/report",
+    "legacy_template": "/api/inspection-template",
+    "legacy_inspection": "/api/inspections/{id}",
+}
+
+def _url(name: str, **kwargs) -> str:
+    """Return the path for a named endpoint."""
+    return ENDPOINTS[name].format(**kwargs)
+
 class APIV1IntegrationTest:
     """Integration test for API v1 endpoints."""
     
     def __init__(self):
-        self.client = TestClient(app)
+        self.client = get_client()
         self.test_results = []
     
     def test_health_endpoint(self) -> bool:
         """Test the health check endpoint."""
         try:
-            response = self.client.get("/healthz")
+            response = self.client.get(_url("health"))
             assert response.status_code == 200
             data = response.json()
             assert data["status"] == "ok"
@@ -40,7 +67,7 @@ class APIV1IntegrationTest:
     def test_inspection_template_v1(self) -> bool:
         """Test the inspection template endpoint."""
         try:
-            response = self.client.get("/api/v1/inspection/template")
+            response = self.client.get(_url("template"))
             assert response.status_code == 200
             data = response.json()
             assert "inspection_points" in data
@@ -67,7 +94,7 @@ class APIV1IntegrationTest:
                 ]
             }
             
-            response = self.client.post("/api/v1/inspection", json=inspection_data)
+            response = self.client.post(_url("inspections"), json=inspection_data)
             print(f"Create inspection response status: {response.status_code}")
             print(f"Create inspection response body: {response.text}")
             
@@ -94,7 +121,7 @@ class APIV1IntegrationTest:
                 self.test_results.append(("Get Inspection v1", "SKIP", "No inspection ID available"))
                 return False
             
-            response = self.client.get(f"/api/v1/inspection/{self.test_inspection_id}")
+            response = self.client.get(_url("inspection", id=self.test_inspection_id))
             assert response.status_code == 200
             data = response.json()
             assert data["id"] == self.test_inspection_id
@@ -116,7 +143,7 @@ class APIV1IntegrationTest:
                 "inspector_name": "Test Inspector"
             }
             
-            response = self.client.patch(f"/api/v1/inspection/{self.test_inspection_id}", json=patch_data)
+            response = self.client.patch(_url("inspection", id=self.test_inspection_id), json=patch_data)
             assert response.status_code == 200
             data = response.json()
             assert "message" in data
@@ -133,7 +160,7 @@ class APIV1IntegrationTest:
                 self.test_results.append(("Finalize Inspection v1", "SKIP", "No inspection ID available"))
                 return False
             
-            response = self.client.post(f"/api/v1/inspection/{self.test_inspection_id}/finalize")
+            response = self.client.post(_url("finalize", id=self.test_inspection_id))
             # This might fail if required fields are missing, which is expected
             if response.status_code == 200:
                 data = response.json()
@@ -156,7 +183,7 @@ class APIV1IntegrationTest:
                 self.test_results.append(("Report Inspection v1", "SKIP", "No inspection ID available"))
                 return False
             
-            response = self.client.get(f"/api/v1/inspection/{self.test_inspection_id}/report")
+            response = self.client.get(_url("report", id=self.test_inspection_id))
             assert response.status_code == 200
             self.test_results.append(("Report Inspection v1", "PASS", "Report generated successfully"))
             return True
@@ -168,14 +195,14 @@ class APIV1IntegrationTest:
         """Test legacy endpoint compatibility."""
         try:
             # Test legacy template endpoint
-            response = self.client.get("/api/inspection-template")
+            response = self.client.get(_url("legacy_template"))
             assert response.status_code == 200
             data = response.json()
             assert "inspection_points" in data
             
             # Test legacy inspection endpoint
             if hasattr(self, 'test_inspection_id'):
-                response = self.client.get(f"/api/inspections/{self.test_inspection_id}")
+                response = self.client.get(_url("legacy_inspection", id=self.test_inspection_id))
                 assert response.status_code == 200
                 data = response.json()
                 assert data["id"] == self.test_inspection_id
@@ -202,28 +229,18 @@ class APIV1IntegrationTest:
             self.test_legacy_compatibility,
         ]
         
-        passed = 0
-        failed = 0
-        skipped = 0
-        
         for test in tests:
             try:
-                if test():
-                    passed += 1
-                else:
-                    failed += 1
+                test()
             except Exception as e:
-                failed += 1
+                self.test_results.append((test.__name__, "FAIL", str(e)))
                 print(f"❌ Test {test.__name__} failed with exception: {e}")
         
-        # Count results
-        for test_name, status, message in self.test_results:
-            if status == "PASS":
-                passed += 1
-            elif status == "FAIL":
-                failed += 1
-            elif status == "SKIP":
-                skipped += 1
+        # Count results once, from the recorded outcomes
+        counts = Counter(status for _, status, _ in self.test_results)
+        passed = counts["PASS"]
+        failed = counts["FAIL"]
+        skipped = counts["SKIP"]
         
         # Print results
         print("\n📊 Test Results:")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the inspection data-file cache.
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from modules.inspection import service
+
+# Format produced by service.generate_inspection_id
+_ID_RE = re.compile(r"INSP_[0-9a-f]{8}")
+
+
+class TestInspectionCache(unittest.TestCase):
+    """Test cases for cached inspection lookups."""
+
+    def setUp(self):
+        """Point the service at an empty temporary data file."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_file = Path(self.tmpdir.name) / "inspections.json"
+        self.data_file.write_text(json.dumps([
+            {"id": "insp_1", "categories": [], "status": "draft"},
+            {"id": "insp_2", "categories": [], "status": "draft"},
+        ]))
+        patcher = patch.object(service, "get_inspection_data_file", return_value=self.data_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+        service._inspections_cache = None
+
+    def test_find_inspection_parses_file_once(self):
+        """Test that repeated lookups reuse the parsed file."""
+        with patch.object(service.orjson, "loads", wraps=orjson.loads) as mock_load:
+            self.assertEqual(service.find_inspection("insp_1")["id"], "insp_1")
+            self.assertEqual(service.find_inspection("insp_2")["id"], "insp_2")
+            self.assertIsNone(service.find_inspection("missing"))
+        self.assertEqual(mock_load.call_count, 1)
+
+    def test_find_inspection_returns_copy(self):
+        """Test that modifying a found inspection does not change the cache."""
+        inspection = service.find_inspection("insp_1")
+        inspection["status"] = "completed"
+        self.assertEqual(service.find_inspection("insp_1")["status"], "draft")
+
+    def test_update_inspection_writes_and_refreshes_cache(self):
+        """Test that an update is visible without re-reading the file."""
+        inspection = service.find_inspection("insp_2")
+        inspection["status"] = "completed"
+        self.assertTrue(service.update_inspection("insp_2", inspection))
+
+        with patch.object(service.orjson, "loads", wraps=orjson.loads) as mock_load:
+            self.assertEqual(service.find_inspection("insp_2")["status"], "completed")
+        self.assertEqual(mock_load.call_count, 0)
+        self.assertEqual(json.loads(self.data_file.read_text())[1]["status"], "completed")
+
+    def test_update_inspection_not_found(self):
+        """Test that updating an unknown inspection returns False."""
+        self.assertFalse(service.update_inspection("missing", {"id": "missing"}))
+
+    def test_external_change_is_reloaded(self):
+        """Test that a file rewritten by another process is re-read."""
+        service.find_inspection("insp_1")
+        self.data_file.write_text(json.dumps([{"id": "insp_3", "categories": []}]))
+
+        self.assertIsNone(service.find_inspection("insp_1"))
+        self.assertEqual(service.find_inspection("insp_3")["id"], "insp_3")
+
+    def test_same_size_rewrite_with_same_mtime_is_reloaded(self):
+        """Test that a rewrite keeping the file's size and mtime is not served stale."""
+        service.find_inspection("insp_1")
+        stat = os.stat(self.data_file)
+        original = self.data_file.read_text()
+        self.data_file.write_text(original.replace('"draft"', '"final"', 1))
+        os.utime(self.data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.stat(self.data_file).st_size, stat.st_size)
+
+        self.assertEqual(service.find_inspection("insp_1")["status"], "final")
+
+
+
+class TestGenerateInspectionId(unittest.TestCase):
+    """Test cases for inspection ID generation."""
+
+    def test_id_format(self):
+        """Test that IDs are the INSP_ prefix followed by 8 hex digits."""
+        self.assertIsNotNone(_ID_RE.fullmatch(service.generate_inspection_id()))
+
+    def test_ids_within_same_second_are_unique(self):
+        """Test that IDs generated back to back do not collide."""
+        ids = {service.generate_inspection_id() for _ in range(100)}
+        self.assertEqual(len(ids), 100)
+
+
+@unittest.skipUnless(os.getenv("RUN_BENCHMARKS") == "1", "set RUN_BENCHMARKS=1 to run")
+class TestInspectionServiceBenchmark(unittest.TestCase):
+    """Timing checks for inspection service operations on a large data file."""
+
+    INSPECTION_COUNT = 10_000
+
+    def setUp(self):
+        """Point the service at a temporary file holding many inspections."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data_file = Path(self.tmpdir.name) / "inspections.json"
+        self.data_file.write_bytes(orjson.dumps([
+            {"id": f"insp_{n}", "categories": [], "status": "draft"}
+            for n in range(self.INSPECTION_COUNT)
+        ]))
+        patcher = patch.object(service, "get_inspection_data_file", return_value=self.data_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+        service._inspections_cache = None
+
+    def _time(self, label, func, rounds):
+        """Run func rounds times and report the mean duration in milliseconds."""
+        start = time.perf_counter()
+        for _ in range(rounds):
+            func()
+        mean_ms = (time.perf_counter() - start) / rounds * 1000
+        print(f"⏱️  {label}: {mean_ms:.3f} ms/op over {rounds} rounds")
+        return mean_ms
+
+    def test_find_inspection_benchmark(self):
+        """Time cached lookups against the last inspection in the file."""
+        last_id = f"insp_{self.INSPECTION_COUNT - 1}"
+        service.find_inspection(last_id)
+        mean_ms = self._time("find_inspection", lambda: service.find_inspection(last_id), 1000)
+        # A cached lookup re-reads the file but must not re-parse it
+        self.assertLess(mean_ms, 1.0)
+
+    def test_update_inspection_benchmark(self):
+        """Time updates, which rewrite the whole data file."""
+        inspection = service.find_inspection("insp_0")
+        self._time("update_inspection", lambda: service.update_inspection("insp_0", inspection), 20)
+
+    def test_save_inspection_benchmark(self):
+        """Time creating new inspections."""
+        self._time(
+            "save_inspection",
+            lambda: service.save_inspection({"id": service.generate_inspection_id(), "categories": []}),
+            20
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
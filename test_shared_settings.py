@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared service settings.
+"""
+
+import importlib.util
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add the services directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'services'))
+
+HAS_PYDANTIC_SETTINGS = importlib.util.find_spec("pydantic_settings") is not None
+
+if HAS_PYDANTIC_SETTINGS:
+    # The module builds its global settings on import, which needs SERVICE_NAME
+    with patch.dict(os.environ, {'SERVICE_NAME': 'test-service'}):
+        from _shared.config.settings import DatabaseSettings
+
+
+@unittest.skipUnless(HAS_PYDANTIC_SETTINGS, "pydantic-settings is not installed")
+class TestDatabaseSettings(unittest.TestCase):
+    """Test cases for database settings read from the environment."""
+
+    def test_pool_defaults(self):
+        """Test the pool defaults when no DB_ variables are set."""
+        with patch.dict(os.environ, {}, clear=True):
+            db = DatabaseSettings()
+        self.assertEqual(db.pool_size, 10)
+        self.assertEqual(db.max_overflow, 20)
+        self.assertEqual(db.pool_timeout, 5.0)
+        self.assertEqual(db.pool_recycle, 1800)
+        self.assertEqual(db.statement_cache_size, 500)
+
+    def test_pool_settings_from_env(self):
+        """Test that the DB_ variables documented in env.example configure the engine."""
+        env = {
+            'DB_POOL_SIZE': '3',
+            'DB_MAX_OVERFLOW': '4',
+            'DB_POOL_TIMEOUT': '1.5',
+            'DB_POOL_RECYCLE': '600',
+            'DB_STATEMENT_CACHE_SIZE': '50',
+        }
+        with patch.dict(os.environ, env, clear=True):
+            db = DatabaseSettings()
+        self.assertEqual(db.pool_size, 3)
+        self.assertEqual(db.max_overflow, 4)
+        self.assertEqual(db.pool_timeout, 1.5)
+        self.assertEqual(db.pool_recycle, 600)
+        self.assertEqual(db.statement_cache_size, 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
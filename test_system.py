@@ -6,11 +6,18 @@ Test script to verify the automotive service-based architecture.
 import asyncio
 import httpx
 import json
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
 
 # Define headers for API requests
 headers = {"Content-Type": "application/json"}
 
+# Seconds a service health result is reused before probing again
+HEALTH_CACHE_TTL = 10.0
+
+# Dead services fail on connect within 2s; responsive ones get 5s to answer
+HEALTH_CHECK_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
 
 class SystemTester:
     """Test the automotive service system."""
@@ -21,34 +28,71 @@ class SystemTester:
         self.auth_token = None
         self.customer_id = None
         self.vehicle_id = None
+        self.client: Optional[httpx.AsyncClient] = None
+        # url -> (checked_at, healthy, detail)
+        self._health_cache: Dict[str, Tuple[float, bool, str]] = {}
+    
+    async def __aenter__(self) -> "SystemTester":
+        """Open one pooled client shared by every test flow.
+        
+        HTTP/2 is negotiated over TLS, so against an https base URL the
+        concurrent requests share one multiplexed connection.
+        """
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(connect=2.0, read=10.0, write=5.0, pool=5.0)
+        )
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the shared client."""
+        await self.client.aclose()
+    
+    async def _probe_health(self, url: str) -> Tuple[bool, str]:
+        """Probe url/health, reusing a result younger than HEALTH_CACHE_TTL."""
+        cached = self._health_cache.get(url)
+        if cached and time.monotonic() - cached[0] < HEALTH_CACHE_TTL:
+            return cached[1], cached[2]
+        
+        try:
+            response = await self.client.get(f"{url}/health", timeout=HEALTH_CHECK_TIMEOUT)
+            ok = response.status_code == 200
+            detail = "Healthy" if ok else f"Unhealthy ({response.status_code})"
+        except Exception as e:
+            ok, detail = False, f"Error - {e}"
+        
+        self._health_cache[url] = (time.monotonic(), ok, detail)
+        return ok, detail
     
     async def test_health_checks(self) -> bool:
         """Test health checks for all services."""
         print("🔍 Testing health checks...")
         
-        from app.config.runtime import build_url
         services = [
-            ("API Gateway", build_url("")),
-            ("Customer Service", build_url("")),  # Will be updated based on service configuration
-            ("Vehicle Service", build_url("")),   # Will be updated based on service configuration
-            ("Appointment Service", build_url("")), # Will be updated based on service configuration
-            ("Workshop Service", build_url("")),   # Will be updated based on service configuration
-            ("Inventory Service", build_url("")),  # Will be updated based on service configuration
-            ("Notification Service", build_url("")), # Will be updated based on service configuration
+            ("API Gateway", self.base_url),
+            ("Customer Service", self.base_url),  # Will be updated based on service configuration
+            ("Vehicle Service", self.base_url),   # Will be updated based on service configuration
+            ("Appointment Service", self.base_url), # Will be updated based on service configuration
+            ("Workshop Service", self.base_url),   # Will be updated based on service configuration
+            ("Inventory Service", self.base_url),  # Will be updated based on service configuration
+            ("Notification Service", self.base_url), # Will be updated based on service configuration
         ]
         
-        async with httpx.AsyncClient() as client:
-            for name, url in services:
-                try:
-                    response = await client.get(f"{url}/health", timeout=5.0)
-                    if response.status_code == 200:
-                        print(f"✅ {name}: Healthy")
-                    else:
-                        print(f"❌ {name}: Unhealthy ({response.status_code})")
-                        return False
-                except Exception as e:
-                    print(f"❌ {name}: Error - {e}")
-                    return False
+        # Services sharing a base URL are probed once; all distinct URLs are
+        # probed at once, so the total wait is the slowest probe
+        unique_urls = list(dict.fromkeys(url for _, url in services))
+        results = dict(zip(
+            unique_urls,
+            await asyncio.gather(*(self._probe_health(url) for url in unique_urls))
+        ))
+        
+        for name, url in services:
+            ok, detail = results[url]
+            print(f"{'✅' if ok else '❌'} {name}: {detail}")
+        
+        if not all(ok for ok, _ in results.values()):
+            return False
         
         print("✅ All services are healthy!")
         return True
@@ -63,117 +107,116 @@ class SystemTester:
         """Test customer management flow."""
         print("\n👥 Testing customer management flow...")
         
-        async with httpx.AsyncClient() as client:
-            
-            # Create customer
-            customer_data = {
-                "name": "John Doe",
-                "company": "ABC Automotive",
-                "tax_id": "12-3456789",
-                "notes": "Test customer",
-                "address": {
-                    "street": "123 Main St",
-                    "city": "Anytown",
-                    "state": "CA",
-                    "zip_code": "90210",
-                    "country": "USA"
-                },
-                "contact": {
-                    "phone": "555-123-4567",
-                    "email": "john@abc.com",
-                    "website": "https://abc.com"
-                }
+        client = self.client
+        
+        # Create customer
+        customer_data = {
+            "name": "John Doe",
+            "company": "ABC Automotive",
+            "tax_id": "12-3456789",
+            "notes": "Test customer",
+            "address": {
+                "street": "123 Main St",
+                "city": "Anytown",
+                "state": "CA",
+                "zip_code": "90210",
+                "country": "USA"
+            },
+            "contact": {
+                "phone": "555-123-4567",
+                "email": "john@abc.com",
+                "website": "https://abc.com"
             }
+        }
+        
+        try:
+            response = await client.post(
+                f"{self.base_url}/v1/customers",
+                json=customer_data,
+                headers=headers
+            )
             
-            try:
-                response = await client.post(
-                    f"{self.base_url}/v1/customers",
-                    json=customer_data,
-                    headers=headers,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self.customer_id = data["data"]["id"]
-                    print("✅ Customer creation successful")
-                else:
-                    print(f"❌ Customer creation failed: {response.status_code}")
-                    print(f"Response: {response.text}")
-                    return False
-                
-                # Get customer list
-                response = await client.get(
-                    f"{self.base_url}/v1/customers",
-                    headers=headers,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    print("✅ Customer list retrieval successful")
-                    return True
-                else:
-                    print(f"❌ Customer list failed: {response.status_code}")
-                    return False
-                    
-            except Exception as e:
-                print(f"❌ Customer flow error: {e}")
+            if response.status_code == 200:
+                data = response.json()
+                self.customer_id = data["data"]["id"]
+                print("✅ Customer creation successful")
+            else:
+                print(f"❌ Customer creation failed: {response.status_code}")
+                print(f"Response: {response.text}")
+                return False
+            
+            # Get customer list
+            response = await client.get(
+                f"{self.base_url}/v1/customers",
+                headers=headers
+            )
+            
+            if response.status_code == 200:
+                print("✅ Customer list retrieval successful")
+                return True
+            else:
+                print(f"❌ Customer list failed: {response.status_code}")
                 return False
+                
+        except Exception as e:
+            print(f"❌ Customer flow error: {e}")
+            return False
     
     async def test_vehicle_flow(self) -> bool:
         """Test vehicle management flow."""
         print("\n🚗 Testing vehicle management flow...")
         
-        async with httpx.AsyncClient() as client:
-            
-            # Create vehicle
-            vehicle_data = {
-                "vin": "1HGBH41JXMN109186",
-                "year": "2021",
-                "make": "Honda",
-                "model": "Civic",
-                "trim": "EX",
-                "engine": "1.5L Turbo",
-                "transmission": "CVT",
-                "body_style": "Sedan",
-                "fuel_type": "Gasoline",
-                "drivetrain": "FWD"
-            }
-            
-            try:
-                response = await client.post(
+        client = self.client
+        
+        # Create vehicle
+        vehicle_data = {
+            "vin": "1HGBH41JXMN109186",
+            "year": "2021",
+            "make": "Honda",
+            "model": "Civic",
+            "trim": "EX",
+            "engine": "1.5L Turbo",
+            "transmission": "CVT",
+            "body_style": "Sedan",
+            "fuel_type": "Gasoline",
+            "drivetrain": "FWD"
+        }
+        
+        try:
+            # VIN decoding only needs the VIN, so run it alongside the create
+            response, decode_response = await asyncio.gather(
+                client.post(
                     f"{self.base_url}/v1/vehicles",
                     json=vehicle_data,
-                    headers=headers,
-                    timeout=10.0
+                    headers=headers
+                ),
+                client.get(
+                    f"{self.base_url}/v1/vehicles/decode/{vehicle_data['vin']}",
+                    headers=headers
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self.vehicle_id = data["data"]["id"]
-                    print("✅ Vehicle creation successful")
-                else:
-                    print(f"❌ Vehicle creation failed: {response.status_code}")
-                    print(f"Response: {response.text}")
-                    return False
-                
-                # Test VIN decoding
-                response = await client.get(
-                    f"{self.base_url}/v1/vehicles/decode/1HGBH41JXMN109186",
-                    headers=headers,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    print("✅ VIN decoding successful")
-                    return True
-                else:
-                    print(f"❌ VIN decoding failed: {response.status_code}")
-                    return False
-                    
-            except Exception as e:
-                print(f"❌ Vehicle flow error: {e}")
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                self.vehicle_id = data["data"]["id"]
+                print("✅ Vehicle creation successful")
+            else:
+                print(f"❌ Vehicle creation failed: {response.status_code}")
+                print(f"Response: {response.text}")
+                return False
+            
+            # Test VIN decoding
+            response = decode_response
+            if response.status_code == 200:
+                print("✅ VIN decoding successful")
+                return True
+            else:
+                print(f"❌ VIN decoding failed: {response.status_code}")
                 return False
+                
+        except Exception as e:
+            print(f"❌ Vehicle flow error: {e}")
+            return False
     
     async def test_workshop_flow(self) -> bool:
         """Test workshop management flow."""
@@ -183,71 +226,79 @@ class SystemTester:
             print("❌ Missing required data for workshop flow")
             return False
         
-        async with httpx.AsyncClient() as client:
-            
-            # Create estimate
-            estimate_data = {
-                "customer_id": self.customer_id,
-                "vehicle_id": self.vehicle_id,
-                "items": [
-                    {
-                        "description": "Oil Change",
-                        "quantity": 1,
-                        "unit_price": 29.99,
-                        "item_type": "service"
-                    },
-                    {
-                        "description": "Oil Filter",
-                        "quantity": 1,
-                        "unit_price": 8.99,
-                        "item_type": "parts"
-                    }
-                ],
-                "notes": "Regular maintenance"
-            }
+        client = self.client
+        
+        # Create estimate
+        estimate_data = {
+            "customer_id": self.customer_id,
+            "vehicle_id": self.vehicle_id,
+            "items": [
+                {
+                    "description": "Oil Change",
+                    "quantity": 1,
+                    "unit_price": 29.99,
+                    "item_type": "service"
+                },
+                {
+                    "description": "Oil Filter",
+                    "quantity": 1,
+                    "unit_price": 8.99,
+                    "item_type": "parts"
+                }
+            ],
+            "notes": "Regular maintenance"
+        }
+        
+        try:
+            response = await client.post(
+                f"{self.base_url}/v1/workshop/estimates",
+                json=estimate_data,
+                headers=headers
+            )
             
-            try:
-                response = await client.post(
-                    f"{self.base_url}/v1/workshop/estimates",
-                    json=estimate_data,
-                    headers=headers,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    print("✅ Estimate creation successful")
-                    return True
-                else:
-                    print(f"❌ Estimate creation failed: {response.status_code}")
-                    print(f"Response: {response.text}")
-                    return False
-                    
-            except Exception as e:
-                print(f"❌ Workshop flow error: {e}")
+            if response.status_code == 200:
+                print("✅ Estimate creation successful")
+                return True
+            else:
+                print(f"❌ Estimate creation failed: {response.status_code}")
+                print(f"Response: {response.text}")
                 return False
+                
+        except Exception as e:
+            print(f"❌ Workshop flow error: {e}")
+            return False
+    
+    async def _run_test(self, test_name: str, test_func) -> Tuple[str, bool]:
+        """Run one test, treating an unexpected exception as a failure."""
+        try:
+            return test_name, await test_func()
+        except Exception as e:
+            print(f"❌ {test_name} failed with exception: {e}")
+            return test_name, False
     
     async def run_all_tests(self) -> bool:
         """Run all system tests."""
         print("🚀 Starting Automotive System Tests")
         print("=" * 50)
         
-        tests = [
-            ("Health Checks", self.test_health_checks),
-            ("Authentication Flow", self.test_auth_flow),
-            ("Customer Management", self.test_customer_flow),
-            ("Vehicle Management", self.test_vehicle_flow),
-            ("Workshop Management", self.test_workshop_flow),
+        # Tests in the same phase are independent and run concurrently;
+        # workshop needs the customer and vehicle ids, so it runs last
+        phases = [
+            [("Health Checks", self.test_health_checks)],
+            [("Authentication Flow", self.test_auth_flow)],
+            [
+                ("Customer Management", self.test_customer_flow),
+                ("Vehicle Management", self.test_vehicle_flow),
+            ],
+            [("Workshop Management", self.test_workshop_flow)],
         ]
         
         results = []
         
-        for test_name, test_func in tests:
-            try:
-                result = await test_func()
-                results.append((test_name, result))
-            except Exception as e:
-                print(f"❌ {test_name} failed with exception: {e}")
-                results.append((test_name, False))
+        for phase in phases:
+            results.extend(await asyncio.gather(
+                *(self._run_test(test_name, test_func) for test_name, test_func in phase)
+            ))
         
         # Print summary
         print("\n" + "=" * 50)
@@ -273,8 +324,8 @@ class SystemTester:
 
 async def main():
     """Main test function."""
-    tester = SystemTester()
-    success = await tester.run_all_tests()
+    async with SystemTester() as tester:
+        success = await tester.run_all_tests()
     
     if success:
         print("\n🎯 System is ready for use!")